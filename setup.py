@@ -1,10 +1,20 @@
 """
 Setup configuration for PolyDB
 Note: All configuration is in pyproject.toml (PEP 621)
-This file exists for backwards compatibility only
+This file exists for backwards compatibility only, plus the opt-in
+mypyc build of the CRUD orchestration module (POLYDB_MYPYC=1).
 """
 
+import os
+
 from setuptools import setup
 
+ext_modules = []
+if os.getenv("POLYDB_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Python-overhead-bound orchestration; the .py source stays the fallback
+    ext_modules = mypycify(["src/polydb/databaseFactory.py"], opt_level="3")
+
 # All configuration is in pyproject.toml
-setup()
\ No newline at end of file
+setup(ext_modules=ext_modules)
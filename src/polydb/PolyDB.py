@@ -734,3 +734,5 @@ class PolyDB:
         if not self.migration_manager:
             raise RuntimeError("Tenant migration manager is not configured.")
         self.migration_manager.deprovision_tenant(tenant_id)
+        if self.tenant_enforcer:
+            self.tenant_enforcer.invalidate(tenant_id)
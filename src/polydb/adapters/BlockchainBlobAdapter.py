@@ -4,10 +4,10 @@ import os
 from typing import Any, Dict, List, Optional
 
 import ipfshttpclient
-from dotenv import load_dotenv
 
 from ..base.ObjectStorageAdapter import ObjectStorageAdapter
 from ..errors import StorageError
+from ..utils import load_dotenv_once
 
 
 class BlockchainBlobAdapter(ObjectStorageAdapter):
@@ -22,7 +22,7 @@ class BlockchainBlobAdapter(ObjectStorageAdapter):
     def __init__(self, ipfs_url: Optional[str] = None):
         super().__init__()
 
-        load_dotenv()
+        load_dotenv_once()
 
         self.ipfs_url = ipfs_url or os.getenv("IPFS_API_URL", "/dns/localhost/tcp/5001/http")
 
@@ -7,7 +7,8 @@ from typing import Any, Dict, Optional
 
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
-from dotenv import load_dotenv
+
+from ..utils import load_dotenv_once
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,7 @@ class BlockchainKVAdapter:
         contract_address: Optional[str] = None,
         contract_abi: Optional[list] = None,
     ):
-        load_dotenv()
+        load_dotenv_once()
 
         self.chain = (chain or os.getenv("BLOCKCHAIN_CHAIN", "ethereum")).lower()
 
@@ -7,9 +7,9 @@ from typing import Any, Dict, List, Optional
 
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
-from dotenv import load_dotenv
 
 from ..errors import QueueError
+from ..utils import load_dotenv_once
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class BlockchainQueueAdapter:
         contract_address: Optional[str] = None,
         contract_abi: Optional[list] = None,
     ):
-        load_dotenv()
+        load_dotenv_once()
 
         self.rpc_url = rpc_url or os.getenv("BLOCKCHAIN_RPC_URL")
         self.private_key = private_key or os.getenv("BLOCKCHAIN_PRIVATE_KEY")
@@ -34,6 +34,8 @@ class DynamoDBAdapter(NoSQLKVAdapter):
     """
 
     DYNAMODB_MAX_SIZE = 400 * 1024  # 400KB DynamoDB item limit
+    # Query/Scan Limit caps items read *before* FilterExpression runs
+    supports_filtered_limit = False
 
     def __init__(
         self,
@@ -17,6 +17,7 @@ from ..base.NoSQLKVAdapter import NoSQLKVAdapter
 from ..errors import ConnectionError, NoSQLError
 from ..json_safe import json_safe
 from ..models import PartitionConfig
+from ..query import Operator
 from ..retry import retry
 from ..types import JsonDict
 
@@ -35,6 +36,8 @@ class FirestoreAdapter(NoSQLKVAdapter):
 
     FIRESTORE_MAX_SIZE = 1024 * 1024  # 1MB doc limit (practical)
 
+    pushdown_operators = frozenset({Operator.EQ, Operator.IN})
+
     def __init__(
         self,
         partition_config: Optional[PartitionConfig] = None,
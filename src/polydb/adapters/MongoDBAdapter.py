@@ -5,18 +5,21 @@ from __future__ import annotations
 import os
 import re
 import threading
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..base.NoSQLKVAdapter import NoSQLKVAdapter
 from ..errors import NoSQLError, ConnectionError, DatabaseError
 from ..retry import retry
 from ..types import JsonDict
 from ..models import PartitionConfig
+from ..query import Operator, QueryBuilder, QueryFilter
 
 
 class MongoDBAdapter(NoSQLKVAdapter):
     """MongoDB adapter compatible with PolyDB contract"""
 
+    pushdown_operators = frozenset({Operator.EQ, Operator.IN})
+
     def __init__(
         self,
         partition_config: Optional[PartitionConfig] = None,
@@ -222,6 +225,26 @@ class MongoDBAdapter(NoSQLKVAdapter):
         except Exception as e:
             raise NoSQLError(f"MongoDB query failed: {e}")
 
+    def _translate_pushdown(
+        self, model: type, builder: QueryBuilder
+    ) -> Tuple[Dict[str, Any], List[QueryFilter]]:
+        """
+        Pushed EQ/IN filters as array-safe operator expressions.
+
+        A plain ``{field: v}`` (or ``$in``) also matches arrays containing ``v``,
+        which the in-memory EQ/IN never do, so array-valued fields are excluded.
+        """
+        pushdown, residual = super()._translate_pushdown(model, builder)
+        exprs: Dict[str, Any] = {}
+        for key, value in pushdown.items():
+            if key.endswith("__in"):
+                field, op = key[:-4], "$in"
+            else:
+                field, op = key, "$eq"
+            expr = exprs.setdefault(field, {"$not": {"$type": "array"}})
+            expr[op] = value
+        return exprs, residual
+
     # -----------------------------------------------------
     # DELETE
     # -----------------------------------------------------
@@ -32,6 +32,11 @@ class PostgreSQLAdapter:
             raise ConnectionError("POSTGRES_CONNECTION_STRING or POSTGRES_URL must be set")
         self._pool = None
         self._lock = threading.Lock()
+        # One slot per pooled connection: callers wait for a free connection
+        # instead of hitting psycopg2's "connection pool exhausted" error.
+        self._max_connections = int(os.getenv("POSTGRES_MAX_CONNECTIONS", "20"))
+        self._slots = threading.BoundedSemaphore(self._max_connections)
+        self._checkout_timeout = float(os.getenv("POSTGRES_POOL_TIMEOUT", "30"))
         self._initialize_pool()
 
     def _initialize_pool(self):
@@ -42,7 +47,7 @@ class PostgreSQLAdapter:
                 if not self._pool:
                     self._pool = psycopg2.pool.ThreadedConnectionPool(
                         minconn=int(os.getenv("POSTGRES_MIN_CONNECTIONS", "2")),
-                        maxconn=int(os.getenv("POSTGRES_MAX_CONNECTIONS", "20")),
+                        maxconn=self._max_connections,
                         dsn=self.connection_string,
                     )
                     self.logger.info("PostgreSQL pool initialized")
@@ -52,11 +57,25 @@ class PostgreSQLAdapter:
     def _get_connection(self) -> Any:
         if not self._pool:
             self._initialize_pool()
-        return self._pool.getconn()  # type: ignore
+        if not self._slots.acquire(timeout=self._checkout_timeout):
+            raise ConnectionError(
+                f"No PostgreSQL connection available within {self._checkout_timeout}s"
+            )
+        try:
+            return self._pool.getconn()  # type: ignore
+        except Exception:
+            self._slots.release()
+            raise
 
     def _return_connection(self, conn: Any):
-        if self._pool and conn:
-            self._pool.putconn(conn)
+        if conn is None:
+            return
+        try:
+            if self._pool:
+                self._pool.putconn(conn)
+        finally:
+            # The slot was taken by _get_connection; free it even if putconn fails
+            self._slots.release()
 
     # ---------------------------------------------------------------------
     # TRANSACTIONS
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import threading
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
 
 from .models import AuditRecord
 from ..cloudDatabaseFactory import CloudDatabaseFactory
@@ -11,7 +12,8 @@ from ..cloudDatabaseFactory import CloudDatabaseFactory
 class AuditStorage:
     """Audit log with distributed-safe hash chaining"""
     
-    _lock = threading.Lock()
+    # Reentrant: append() reads chain heads and persists under one hold
+    _lock = threading.RLock()
     
     def __init__(self):
         self.factory = CloudDatabaseFactory()
@@ -64,6 +66,10 @@ class AuditStorage:
     
     def get_last_hash(self, tenant_id: Optional[str]) -> Optional[str]:
         """Get most recent hash with strict ordering (distributed-safe)"""
+        return self._get_head(tenant_id)[0]
+    
+    def _get_head(self, tenant_id: Optional[str]) -> Tuple[Optional[str], Any]:
+        """(hash, timestamp) of the tenant's most recent record, or (None, None)"""
         with self._lock:
             try:
                 from ..query import QueryBuilder, Operator
@@ -78,38 +84,89 @@ class AuditStorage:
                 results = self.sql.query_linq('polydb_audit_log', builder)
                 
                 if results and len(results) > 0:
-                    return results[0].get('hash')
+                    return results[0].get('hash'), results[0].get('timestamp')
                 
-                return None
+                return None, None
             except Exception:
-                return None
+                return None, None
+    
+    def append(self, records: List[AuditRecord]) -> None:
+        """
+        Chain records onto their tenant's stored head and persist them.
+        
+        Heads are re-read from the table on every call, under the same lock as
+        get_last_hash/persist, so other writers sharing the table are picked up.
+        A record stamped before its head (it waited in a queue while another
+        writer appended) is moved to 1µs after it, keeping timestamp order equal
+        to chain order for verify_chain.
+        """
+        if not records:
+            return
+        with self._lock:
+            heads: Dict[Optional[str], Tuple[Optional[str], Any]] = {}
+            for record in records:
+                tenant_id = record.tenant_id
+                if tenant_id not in heads:
+                    heads[tenant_id] = self._get_head(tenant_id)
+                head_hash, head_ts = heads[tenant_id]
+                if head_ts is not None:
+                    if isinstance(head_ts, str):
+                        head_ts = datetime.fromisoformat(head_ts)
+                    if datetime.fromisoformat(record.timestamp) <= head_ts:
+                        record.timestamp = (head_ts + timedelta(microseconds=1)).isoformat()
+                record.seal(head_hash)
+                heads[tenant_id] = (record.hash, record.timestamp)
+            
+            if len(records) == 1:
+                self.persist(records[0])
+            else:
+                self.persist_many(records)
+    
+    @staticmethod
+    def _row(record: AuditRecord) -> Dict[str, Any]:
+        return {
+            'audit_id': record.audit_id,
+            'timestamp': record.timestamp,
+            'tenant_id': record.tenant_id,
+            'actor_id': record.actor_id,
+            'roles': record.roles,
+            'action': record.action,
+            'model': record.model,
+            'entity_id': record.entity_id,
+            'storage_type': record.storage_type,
+            'provider': record.provider,
+            'success': record.success,
+            'before': record.before,
+            'after': record.after,
+            'changed_fields': record.changed_fields,
+            'trace_id': record.trace_id,
+            'request_id': record.request_id,
+            'ip_address': record.ip_address,
+            'user_agent': record.user_agent,
+            'error': record.error,
+            'hash': record.hash,
+            'previous_hash': record.previous_hash,
+        }
     
     def persist(self, record: AuditRecord) -> None:
         """Persist with lock to ensure chain integrity"""
         with self._lock:
-            self.sql.insert('polydb_audit_log', {
-                'audit_id': record.audit_id,
-                'timestamp': record.timestamp,
-                'tenant_id': record.tenant_id,
-                'actor_id': record.actor_id,
-                'roles': record.roles,
-                'action': record.action,
-                'model': record.model,
-                'entity_id': record.entity_id,
-                'storage_type': record.storage_type,
-                'provider': record.provider,
-                'success': record.success,
-                'before': record.before,
-                'after': record.after,
-                'changed_fields': record.changed_fields,
-                'trace_id': record.trace_id,
-                'request_id': record.request_id,
-                'ip_address': record.ip_address,
-                'user_agent': record.user_agent,
-                'error': record.error,
-                'hash': record.hash,
-                'previous_hash': record.previous_hash,
-            })
+            self.sql.insert('polydb_audit_log', self._row(record))
+    
+    def persist_many(self, records: List[AuditRecord]) -> None:
+        """Persist already-chained records with one multi-row INSERT"""
+        if not records:
+            return
+        rows = [self._row(r) for r in records]
+        columns = list(rows[0])
+        row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        sql = (
+            f"INSERT INTO polydb_audit_log ({', '.join(columns)}) VALUES "
+            + ", ".join([row_placeholders] * len(rows))
+        )
+        params = [row[c] for row in rows for c in columns]
+        with self._lock:
+            self.sql.execute(sql, params)
     
     def verify_chain(self, tenant_id: Optional[str] = None) -> bool:
         """Verify hash chain integrity"""
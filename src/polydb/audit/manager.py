@@ -1,16 +1,57 @@
 # src/polydb/audit/manager.py
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
+import threading
+import weakref
 from typing import Optional, Dict, Any, List
 
 from .models import AuditRecord
 from .AuditStorage import AuditStorage
 from .context import AuditContext
 
+logger = logging.getLogger(__name__)
+
+# Queue sentinel telling the writer thread to exit
+_STOP = object()
+
+# Managers with a running writer, closed (and so flushed) at interpreter exit
+_LIVE_MANAGERS: "weakref.WeakSet[AuditManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_managers() -> None:
+    for manager in list(_LIVE_MANAGERS):
+        manager.close()
+
 
 class AuditManager:
-    def __init__(self):
+    def __init__(
+        self,
+        records_before: bool = True,
+        async_writes: bool = False,
+        queue_size: int = 10_000,
+        batch_size: int = 100,
+        put_timeout: float = 1.0,
+    ):
         self.storage = AuditStorage()
+        # When False, writers skip the pre-write read; records lose before/changed_fields
+        self.records_before = records_before
+        # Times record() found the queue full; after put_timeout it writes inline
+        self.blocked_writes = 0
+        self._batch_size = batch_size
+        self._put_timeout = put_timeout
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        # Stamping + enqueueing under one lock keeps queue order == timestamp order
+        self._enqueue_lock = threading.Lock()
+        if async_writes:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._worker = threading.Thread(target=self._drain, name="polydb-audit", daemon=True)
+            self._worker.start()
+            _LIVE_MANAGERS.add(self)
 
     def record(
         self,
@@ -26,10 +67,7 @@ class AuditManager:
         error: Optional[str],
         changed_fields: List[str] | None
     ) -> None:
-        tenant_id = AuditContext.tenant_id.get()
-        previous_hash = self.storage.get_last_hash(tenant_id)
-
-        record = AuditRecord.create(
+        fields = dict(
             action=action,
             model=model,
             entity_id=entity_id,
@@ -41,7 +79,99 @@ class AuditManager:
             changed_fields=changed_fields,
             error=error,
             context=AuditContext,
-            previous_hash=previous_hash,
         )
 
-        self.storage.persist(record)
+        with self._enqueue_lock:
+            # Stamped here so timestamp and AuditContext reflect the operation, not the drain
+            record = AuditRecord.build(**fields)
+            q = self._queue
+            if q is not None:
+                try:
+                    q.put_nowait(record)
+                    return
+                except queue.Full:
+                    self.blocked_writes += 1
+
+        if q is None:
+            self._write(record)
+            return
+
+        # Backpressure outside the lock, so a stalled writer only holds up this caller.
+        # Writing inline is safe: AuditStorage.append chains from the stored head.
+        try:
+            q.put(record, timeout=self._put_timeout)
+        except queue.Full:
+            logger.warning("Audit queue full for %.1fs; writing record inline", self._put_timeout)
+            self._write(record)
+
+    def flush(self) -> None:
+        """Block until every queued record has been persisted."""
+        q = self._queue
+        if q is not None:
+            q.join()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Persist queued records and stop the writer thread.
+
+        Idempotent; records logged after close() are written synchronously.
+        Called for every live manager at interpreter exit.
+        """
+        with self._enqueue_lock:
+            q, self._queue = self._queue, None
+        if q is None:
+            return
+        _LIVE_MANAGERS.discard(self)
+        try:
+            q.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Audit writer did not drain; %d records not persisted", q.qsize())
+            return
+        if self._worker is not None:
+            self._worker.join(timeout)
+            if self._worker.is_alive():
+                return
+
+        # Records a blocked record() slipped in behind the sentinel
+        leftovers: List[AuditRecord] = []
+        while True:
+            try:
+                leftovers.append(q.get_nowait())
+            except queue.Empty:
+                break
+        if leftovers:
+            self.storage.append(leftovers)
+
+    def _write(self, record: AuditRecord) -> None:
+        self.storage.append([record])
+
+    def _drain(self) -> None:
+        q = self._queue
+        assert q is not None
+        stopping = False
+        while not stopping:
+            batch: List[AuditRecord] = []
+            item = q.get()
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    q.task_done()
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+
+            if not batch:
+                continue
+            try:
+                # Chain heads are re-read from the store for every batch
+                self.storage.append(batch)
+            except Exception as exc:
+                logger.error("Audit recording failed for %d records: %s", len(batch), exc)
+            finally:
+                for _ in batch:
+                    q.task_done()
@@ -39,7 +39,14 @@ class AuditRecord:
     previous_hash: Optional[str] = None
 
     @classmethod
-    def create(
+    def create(cls, *, previous_hash: Optional[str] = None, **fields):
+        """Build and seal a record in one step"""
+        record = cls.build(**fields)
+        record.seal(previous_hash)
+        return record
+
+    @classmethod
+    def build(
         cls,
         *,
         action: str,
@@ -53,8 +60,8 @@ class AuditRecord:
         changed_fields: Optional[List[str]],
         error: Optional[str],
         context,
-        previous_hash: Optional[str] = None,
     ):
+        """Stamp an unchained record (time, id, AuditContext) at the moment of the operation"""
         now = datetime.utcnow().isoformat()
         audit_id = str(uuid.uuid4())
 
@@ -78,11 +85,14 @@ class AuditRecord:
             ip_address=context.ip_address.get(),
             user_agent=context.user_agent.get(),
             error=error,
-            previous_hash=previous_hash,
         )
 
-        record.hash = hashlib.sha256(
-            json.dumps(asdict(record), sort_keys=True,default=json_safe).encode()
-        ).hexdigest()
-
         return record
+
+    def seal(self, previous_hash: Optional[str]) -> None:
+        """Link the record to its chain predecessor and compute its hash"""
+        self.previous_hash = previous_hash
+        self.hash = None
+        self.hash = hashlib.sha256(
+            json.dumps(asdict(self), sort_keys=True,default=json_safe).encode()
+        ).hexdigest()
@@ -3,24 +3,146 @@ from __future__ import annotations
 
 import hashlib
 import json
+import string
 import threading
-from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING, cast
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING, cast
 
 
 from ..json_safe import json_safe
 
 from ..errors import NoSQLError, StorageError
 from ..retry import retry
-from ..query import QueryBuilder, Operator
+from ..query import QueryBuilder, QueryFilter, Operator, compile_filters
 from ..types import JsonDict, Lookup
 
 if TYPE_CHECKING:
     from ..models import PartitionConfig
 
+try:
+    import msgspec
+
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=json_safe)
+    _msgspec_sorted_encoder = msgspec.json.Encoder(enc_hook=json_safe, order="sorted")
+except ImportError:  # optional speedup (pip install altcodepro-polydb-python[speedups])
+    _msgspec_encoder = None
+    _msgspec_sorted_encoder = None
+
+try:
+    import xxhash
+
+    _hash64 = xxhash.xxh3_64_intdigest
+except ImportError:  # optional speedup
+    _hash64 = hash
+
+try:
+    import zstandard as zstd
+except ImportError:  # optional speedup
+    zstd = None
+
+# Prefix marking zstd-compressed overflow blobs
+_ZSTD_MAGIC = b"ZST1"
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize to JSON bytes, via msgspec when available"""
+    if _msgspec_encoder is not None:
+        return _msgspec_encoder.encode(data)
+    return json.dumps(data, default=json_safe).encode()
+
+
+def _row_digest(row: JsonDict) -> int:
+    """64-bit fingerprint of a row's canonical (key-sorted) JSON form"""
+    if _msgspec_sorted_encoder is not None:
+        encoded = _msgspec_sorted_encoder.encode(row)
+    else:
+        encoded = json.dumps(row, sort_keys=True, default=json_safe).encode()
+    return _hash64(encoded)
+
+
+_CONVERSIONS = {"r": "repr", "s": "str", "a": "ascii"}
+
+
+@lru_cache(maxsize=256)
+def _compile_key_template(template: str) -> Callable[[JsonDict], str]:
+    """
+    Compile a str.format template into a function of the row dict.
+
+    Equivalent to ``template.format(**data)`` (including KeyError on missing
+    fields) without the per-call parse and dict unpacking. Templates using
+    positional, attribute/index or nested-spec fields keep ``str.format``.
+    """
+    parts: List[str] = []
+    for literal, field_name, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or (spec and "{" in spec):
+            return lambda data: template.format(**data)
+        expr = f"data[{field_name!r}]"
+        if conversion:
+            expr = f"{_CONVERSIONS[conversion]}({expr})"
+        parts.append(f"format({expr}, {spec or ''!r})")
+
+    ns: Dict[str, Any] = {}
+    body = f"''.join(({', '.join(parts)},))" if parts else "''"
+    exec(compile(f"def fmt(data): return {body}", "<polydb-key-template>", "exec"), ns)
+    return ns["fmt"]
+
+
+def _is_pushdown_scalar(value: Any) -> bool:
+    """Whether backends compare ``value`` the way ``_apply_filters`` does"""
+    return type(value) in (str, int, float)
+
+
+# Per-model (pk_field, rk_field), resolved once from __polydb__
+# model class -> (__polydb__ it was read from, (pk_field, rk_field))
+_KEY_FIELDS: "weakref.WeakKeyDictionary[type, Tuple[Any, Tuple[str, str]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+_NO_META: Dict[str, Any] = {}
+
+
+def _key_fields(model: type) -> Tuple[str, str]:
+    meta = getattr(model, "__polydb__", _NO_META)
+    try:
+        cached = _KEY_FIELDS.get(model)
+    except TypeError:  # not weak-referenceable
+        cached = None
+    if cached is not None and cached[0] is meta:
+        return cached[1]
+
+    fields = (
+        meta.get("pk_field") or meta.get("partition_key", "tenant_id"),
+        meta.get("rk_field") or meta.get("sort_key", "id"),
+    )
+    try:
+        _KEY_FIELDS[model] = (meta, fields)
+    except TypeError:  # not weak-referenceable
+        pass
+    return fields
+
+
+# Upper bound on concurrent blob GETs when resolving overflowed rows
+_OVERFLOW_FETCH_WORKERS = 32
+
 
 class NoSQLKVAdapter:
     """Base with auto-overflow and LINQ support"""
 
+    # Operators whose filters ``_query_raw`` evaluates natively. Adapters that
+    # translate ``field__in`` server-side extend this with Operator.IN.
+    pushdown_operators = frozenset({Operator.EQ})
+    # Whether ``_query_raw`` applies ``limit`` after its filters. Backends that cap
+    # the items *examined* (DynamoDB's Limit) set this False, so a limit hint is
+    # only sent with an empty filter dict.
+    supports_filtered_limit = True
+
     def __init__(
         self,
         partition_config: Optional[PartitionConfig] = None,
@@ -32,16 +154,15 @@ class NoSQLKVAdapter:
         self.object_storage = None
         self._lock = threading.Lock()
         self.max_size = 1024 * 1024  # 1MB
+        self.compress_overflow = True  # zstd level 1, when zstandard is installed
 
     def _get_pk_rk(self, model: type, data: JsonDict) -> Tuple[str, str]:
         """Extract PK/RK from model metadata"""
-        meta = getattr(model, "__polydb__", {})
-        pk_field = meta.get("pk_field") or meta.get("partition_key", "tenant_id")
-        rk_field = meta.get("rk_field") or meta.get("sort_key", "id")
+        pk_field, rk_field = _key_fields(model)
 
         if self.partition_config:
             try:
-                pk = self.partition_config.partition_key_template.format(**data)
+                pk = _compile_key_template(self.partition_config.partition_key_template)(data)
             except KeyError:
                 pk = f"default_{data.get(pk_field, hashlib.md5(json.dumps(data, sort_keys=True,default=json_safe).encode()).hexdigest()[:8])}"
         else:
@@ -51,7 +172,7 @@ class NoSQLKVAdapter:
             rk = str(data[rk_field])
         elif self.partition_config and self.partition_config.row_key_template:
             try:
-                rk = self.partition_config.row_key_template.format(**data)
+                rk = _compile_key_template(self.partition_config.row_key_template)(data)
             except KeyError:
                 rk = hashlib.md5(
                     json.dumps(data, sort_keys=True, default=json_safe).encode()
@@ -67,71 +188,191 @@ class NoSQLKVAdapter:
         return str(pk), str(rk)
 
     @retry(max_attempts=3, delay=1.0, exceptions=(NoSQLError,))
-    def _check_overflow(self, data: JsonDict) -> Tuple[JsonDict, Optional[str]]:
-        """Check size and store in blob if needed"""
-        data_bytes = json.dumps(data, default=json_safe).encode()
+    def _check_overflow(
+        self, data: JsonDict, keep: Sequence[str] = ()
+    ) -> Tuple[JsonDict, Optional[str]]:
+        """
+        Check size and store in blob if needed.
+
+        The stub left in the row keeps the ``keep`` fields (the model's
+        indexed_fields), so filters pushed down to ``_query_raw`` still see them.
+        """
+        # Encoded once: the same bytes are measured, checksummed and uploaded
+        data_bytes = _encode_json(data)
         data_size = len(data_bytes)
 
         if data_size > self.max_size:
-            with self._lock:
-                if not self.object_storage:
-                    from ..cloudDatabaseFactory import CloudDatabaseFactory
+            self._get_object_storage()
 
-                    factory = CloudDatabaseFactory()
-                    self.object_storage = factory.get_object_storage()
+            payload = data_bytes
+            if self.compress_overflow and zstd is not None:
+                payload = _ZSTD_MAGIC + zstd.ZstdCompressor(level=1, threads=-1).compress(
+                    data_bytes
+                )
 
-            blob_id = hashlib.md5(data_bytes).hexdigest()
+            # Checksum covers the bytes actually stored
+            blob_id = hashlib.md5(payload).hexdigest()
             blob_key = f"overflow/{blob_id}.json"
 
             try:
-                self.object_storage.put(blob_key, data_bytes)
+                self.object_storage.put(blob_key, payload)
             except Exception as e:
                 raise StorageError(f"Overflow storage failed: {str(e)}")
 
-            return {
-                "_overflow": True,
-                "_blob_key": blob_key,
-                "_size": data_size,
-                "_checksum": blob_id,
-            }, blob_key
+            stub = {k: data[k] for k in keep if k in data}
+            stub.update(
+                {
+                    "_overflow": True,
+                    "_blob_key": blob_key,
+                    "_size": data_size,
+                    "_checksum": blob_id,
+                }
+            )
+            return stub, blob_key
 
         return data, None
 
-    @retry(max_attempts=3, delay=1.0, exceptions=(StorageError,))
-    def _retrieve_overflow(self, data: JsonDict) -> JsonDict:
-        """Retrieve from blob if overflow"""
-        if not data.get("_overflow"):
-            return data
-
+    def _get_object_storage(self) -> Any:
+        """Lazily create the object storage used for overflow blobs"""
         with self._lock:
             if not self.object_storage:
                 from ..cloudDatabaseFactory import CloudDatabaseFactory
 
                 factory = CloudDatabaseFactory()
                 self.object_storage = factory.get_object_storage()
+        return self.object_storage
 
+    def _decode_overflow(self, data: JsonDict, blob_data: bytes) -> JsonDict:
+        """Verify checksum and deserialize an overflow blob"""
         try:
-            blob_data = self.object_storage.get(data["_blob_key"])
-            retrieved = json.loads(blob_data.decode())
-
             # Verify checksum
             checksum = hashlib.md5(blob_data).hexdigest()
             if checksum != data.get("_checksum"):
                 raise StorageError("Checksum mismatch on overflow retrieval")
 
-            return retrieved
+            if blob_data[:4] == _ZSTD_MAGIC:
+                if zstd is None:
+                    raise StorageError("zstandard is required to read compressed overflow")
+                blob_data = zstd.ZstdDecompressor().decompress(blob_data[4:])
+
+            return json.loads(blob_data)
         except Exception as e:
             raise StorageError(f"Overflow retrieval failed: {str(e)}")
 
-    def _apply_filters(self, results: List[JsonDict], builder: QueryBuilder) -> List[JsonDict]:
+    @retry(max_attempts=3, delay=1.0, exceptions=(StorageError,))
+    def _retrieve_overflow(self, data: JsonDict) -> JsonDict:
+        """Retrieve from blob if overflow"""
+        if not data.get("_overflow"):
+            return data
+
+        storage = self._get_object_storage()
+
+        try:
+            blob_data = storage.get(data["_blob_key"])
+        except Exception as e:
+            raise StorageError(f"Overflow retrieval failed: {str(e)}")
+
+        return self._decode_overflow(data, blob_data)
+
+    def _retrieve_overflow_many(self, results: List[JsonDict]) -> List[JsonDict]:
+        """
+        Resolve overflowed rows with concurrent blob fetches.
+
+        Inline rows are returned untouched. Uses the storage backend's
+        ``get_many`` when it provides one, otherwise a bounded thread pool.
+        """
+        overflowed = [i for i, r in enumerate(results) if r.get("_overflow")]
+        if not overflowed:
+            return results
+
+        results = list(results)
+
+        if len(overflowed) == 1:
+            i = overflowed[0]
+            results[i] = self._retrieve_overflow(results[i])
+            return results
+
+        storage = self._get_object_storage()
+        get_many = getattr(storage, "get_many", None)
+
+        if callable(get_many):
+            try:
+                blobs = get_many([results[i]["_blob_key"] for i in overflowed])
+            except Exception as e:
+                raise StorageError(f"Overflow retrieval failed: {str(e)}")
+            for i, blob_data in zip(overflowed, blobs):
+                results[i] = self._decode_overflow(results[i], blob_data)
+            return results
+
+        workers = min(_OVERFLOW_FETCH_WORKERS, len(overflowed))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = pool.map(self._retrieve_overflow, [results[i] for i in overflowed])
+            for i, row in zip(overflowed, fetched):
+                results[i] = row
+
+        return results
+
+    def _translate_pushdown(
+        self, model: type, builder: QueryBuilder
+    ) -> Tuple[Dict[str, Any], List[QueryFilter]]:
+        """
+        Split builder filters into a ``_query_raw`` filter dict and a residual list.
+
+        Only EQ/IN filters on fields listed in ``__polydb__["indexed_fields"]`` are
+        pushed down; everything else is evaluated in-memory by ``_apply_filters``.
+        ``id`` always stays residual: adapters read ``filters["id"]`` as the
+        partition key, which is not the row id under the default partitioning.
+        Only str/int/float values are pushed, where backend equality matches
+        Python's (no bool/int or container comparisons). Overflow stubs keep
+        the indexed fields (see ``_check_overflow``), so pushed filters still
+        match overflowed rows.
+        """
+        meta = getattr(model, "__polydb__", {}) or {}
+        indexed = meta.get("indexed_fields")
+        if not indexed:
+            return {}, list(builder.filters)
+
+        pushdown: Dict[str, Any] = {}
+        residual: List[QueryFilter] = []
+
+        for f in builder.filters:
+            if (
+                f.field != "id"
+                and f.field in indexed
+                and f.operator in self.pushdown_operators
+            ):
+                if f.operator == Operator.EQ and _is_pushdown_scalar(f.value):
+                    key, value = f.field, f.value
+                elif (
+                    f.operator == Operator.IN
+                    and isinstance(f.value, (list, tuple, set))
+                    and all(map(_is_pushdown_scalar, f.value))
+                ):
+                    key, value = f"{f.field}__in", list(f.value)
+                else:
+                    key, value = None, None
+
+                if key and key not in pushdown:
+                    pushdown[key] = value
+                    continue
+
+            residual.append(f)
+
+        return pushdown, residual
+
+    def _apply_filters(self, results: List[JsonDict], filters: List[QueryFilter]) -> List[JsonDict]:
         """Apply filters in-memory for NoSQL"""
-        if not builder.filters:
+        if not filters:
             return results
 
+        predicate = compile_filters(filters)
+        if predicate is not None:
+            return [item for item in results if predicate(item)]
+
         filtered = []
         for item in results:
             match = True
-            for f in builder.filters:
+            for f in filters:
                 value = item.get(f.field)
 
                 if f.operator == Operator.EQ and value != f.value:
@@ -228,7 +469,7 @@ class NoSQLKVAdapter:
         cache_ttl: Optional[int] = None,
     ) -> List[JsonDict]:
         results = self._query_raw(model, query or {}, limit)
-        return [self._retrieve_overflow(r) for r in results]
+        return self._retrieve_overflow_many(results)
 
     def query_page(
         self, model: type, query: Lookup, page_size: int, continuation_token: Optional[str] = None
@@ -267,7 +508,8 @@ class NoSQLKVAdapter:
                 existing.update(data)
                 data = existing
 
-        store_data, _ = self._check_overflow(data)
+        meta = getattr(model, "__polydb__", {}) or {}
+        store_data, _ = self._check_overflow(data, meta.get("indexed_fields") or ())
         return self._put_raw(model, pk, rk, store_data)  # type: ignore
 
     def upsert(self, model: type, data: JsonDict, *, replace: bool = False) -> JsonDict:
@@ -284,6 +526,27 @@ class NoSQLKVAdapter:
 
         return self._delete_raw(model, pk, rk, etag)  # type: ignore
 
+    def _count_matching(self, results: List[JsonDict], filters: List[QueryFilter]) -> int:
+        """Count rows passing filters; overflow blobs are fetched only when filters need them"""
+        if not filters:
+            return len(results)
+
+        predicate = compile_filters(filters)
+        if predicate is None:
+            return len(self._apply_filters(self._retrieve_overflow_many(results), filters))
+
+        count = 0
+        overflowed = []
+        for r in results:
+            if r.get("_overflow"):
+                overflowed.append(r)
+            elif predicate(r):
+                count += 1
+
+        if overflowed:
+            count += sum(1 for r in self._retrieve_overflow_many(overflowed) if predicate(r))
+        return count
+
     def query_linq_rows(self, model: type, builder: QueryBuilder) -> List[JsonDict]:
         """
         Typed wrapper for queries that return rows.
@@ -294,23 +557,38 @@ class NoSQLKVAdapter:
 
     def query_linq(self, model: type, builder: QueryBuilder) -> Union[List[JsonDict], int]:
         """LINQ-style query"""
-        results = self._query_raw(model, {}, None)
-        results = [self._retrieve_overflow(r) for r in results]
-
-        results = self._apply_filters(results, builder)
+        pushdown, residual = self._translate_pushdown(model, builder)
+
+        # The server can stop early only when nothing is left to filter or sort
+        # in-memory after it returns, and only if its limit counts filtered rows.
+        limit_hint = None
+        if (
+            builder.take_count is not None
+            and not residual
+            and not builder.order_by_fields
+            and not builder.count_only
+            and (not pushdown or self.supports_filtered_limit)
+        ):
+            limit_hint = builder.take_count + builder.skip_count
+
+        results = self._query_raw(model, pushdown, limit_hint)
 
         if builder.count_only:
-            return len(results)
+            return self._count_matching(results, residual)
+
+        results = self._retrieve_overflow_many(results)
+        results = self._apply_filters(results, residual)
 
         results = self._apply_ordering(results, builder)
         results = self._apply_pagination(results, builder)
         results = self._apply_projection(results, builder)
 
         if builder.distinct:
+            # Track 64-bit digests rather than full JSON strings
             seen = set()
             unique = []
             for r in results:
-                key = json.dumps(r, sort_keys=True, default=json_safe)
+                key = _row_digest(r)
                 if key not in seen:
                     seen.add(key)
                     unique.append(r)
@@ -7,9 +7,20 @@ import json
 import hashlib
 import threading
 from enum import Enum
+from functools import lru_cache
 import redis
 from .json_safe import json_safe
 
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install altcodepro-polydb-python[speedups])
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # optional speedup
+    xxhash = None
+
 
 class CacheStrategy(Enum):
     """Cache invalidation strategies"""
@@ -21,6 +32,51 @@ class CacheStrategy(Enum):
     WRITE_BACK = "write_back"
 
 
+# Value types whose (type, value) pair identifies their JSON encoding exactly
+_FLAT_TYPES = (str, int, bool, type(None))
+
+
+def _canonical_query(query: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                query,
+                default=json_safe,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:  # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(query, sort_keys=True, default=json_safe).encode()
+
+
+def _hash_query(query: Dict[str, Any]) -> str:
+    """
+    32-hex-char digest of the key-sorted query.
+
+    xxh3_128 when xxhash is installed, MD5 otherwise; both yield the same
+    key shape, so tenant invalidation globs match either. Instances sharing
+    a Redis should install the same speedups to share cache hits.
+    """
+    data = _canonical_query(query)
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.md5(data).hexdigest()
+
+
+# Glob matching exactly one 32-char hex digest (the untenanted key suffix)
+_HASH_GLOB = "[0-9a-f]" * 32
+
+
+def _glob_escape(value: str) -> str:
+    """Escape Redis glob metacharacters so ``value`` matches only itself"""
+    return "".join("\\" + c if c in "*?[]\\" else c for c in value)
+
+
+@lru_cache(maxsize=10_000)
+def _hash_flat_query(items: frozenset) -> str:
+    return _hash_query({k: v for k, _, v in items})
+
+
 class RedisCacheEngine:
     """Redis-based distributed cache"""
 
@@ -54,18 +110,26 @@ class RedisCacheEngine:
         except ImportError:
             raise ImportError("Redis not installed. Install with: pip install redis")
 
-    def _make_key(self, model: str, query: Dict[str, Any]) -> str:
-        """Generate cache key"""
-        query_str = json.dumps(query, sort_keys=True, default=json_safe)
-        query_hash = hashlib.md5(query_str.encode()).hexdigest()
+    def _make_key(
+        self, model: str, query: Dict[str, Any], tenant_id: Optional[str] = None
+    ) -> str:
+        """Generate cache key (memoized for flat scalar queries)"""
+        if all(type(v) in _FLAT_TYPES for v in query.values()):
+            query_hash = _hash_flat_query(frozenset((k, type(v), v) for k, v in query.items()))
+        else:
+            query_hash = _hash_query(query)
+        if tenant_id:
+            return f"{self.prefix}{model}:{tenant_id}:{query_hash}"
         return f"{self.prefix}{model}:{query_hash}"
 
-    def get(self, model: str, query: Dict[str, Any]) -> Optional[Any]:
+    def get(
+        self, model: str, query: Dict[str, Any], *, tenant_id: Optional[str] = None
+    ) -> Optional[Any]:
         """Get from cache"""
         if not self._client:
             return None
 
-        key = self._make_key(model, query)
+        key = self._make_key(model, query, tenant_id)
 
         try:
             data = self._client.get(key)
@@ -77,12 +141,20 @@ class RedisCacheEngine:
         except Exception:
             return None
 
-    def set(self, model: str, query: Dict[str, Any], value: Any, ttl: Optional[int] = None):
+    def set(
+        self,
+        model: str,
+        query: Dict[str, Any],
+        value: Any,
+        ttl: Optional[int] = None,
+        *,
+        tenant_id: Optional[str] = None,
+    ):
         """Set cache with TTL"""
         if not self._client:
             return
 
-        key = self._make_key(model, query)
+        key = self._make_key(model, query, tenant_id)
         ttl = ttl or self.default_ttl
 
         try:
@@ -94,14 +166,38 @@ class RedisCacheEngine:
         except Exception:
             pass
 
-    def invalidate(self, model: str, query: Optional[Dict[str, Any]] = None):
-        """Invalidate cache"""
+    def invalidate(
+        self,
+        model: str,
+        query: Optional[Dict[str, Any]] = None,
+        *,
+        tenant_id: Optional[str] = None,
+    ):
+        """
+        Invalidate cache.
+
+        With ``tenant_id``, only that tenant's slice is dropped, plus the
+        untenanted entries (which may contain that tenant's rows); other
+        tenants' entries survive. Callers must only scope entries whose rows
+        are confined to one tenant, and only pass ``tenant_id`` for writes
+        confined to that tenant.
+        """
         if not self._client:
             return
 
         if query:
-            key = self._make_key(model, query)
+            key = self._make_key(model, query, tenant_id)
             self._client.delete(key, f"{key}:access_count")
+        elif tenant_id:
+            untenanted = f"{self.prefix}{model}:{_HASH_GLOB}"
+            for pattern in (
+                f"{self.prefix}{model}:{_glob_escape(tenant_id)}:*",
+                untenanted,
+                f"{untenanted}:access_count",
+            ):
+                keys = self._client.keys(pattern)
+                if keys:
+                    self._client.delete(*keys)
         else:
             # Invalidate all for model
             pattern = f"{self.prefix}{model}:*"
@@ -119,6 +215,12 @@ class RedisCacheEngine:
         if keys:
             self._client.delete(*keys)
 
+    def ping(self) -> bool:
+        """Read-only liveness probe (Redis PING); connection errors propagate"""
+        if not self._client:
+            return False
+        return bool(self._client.ping())
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         if not self._client:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import importlib
 import os
 import threading
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from .adapters.AzureFileStorageAdapter import AzureFileStorageAdapter
@@ -45,6 +47,41 @@ from .adapters.BlockchainQueueAdapter import BlockchainQueueAdapter
 from .adapters.SQSAdapter import SQSAdapter
 
 
+# NoSQL KV adapters pull in provider SDKs, so they are imported on first use
+_KV_ADAPTERS = {
+    CloudProvider.AZURE: "AzureTableStorageAdapter",
+    CloudProvider.AWS: "DynamoDBAdapter",
+    CloudProvider.GCP: "FirestoreAdapter",
+    CloudProvider.VERCEL: "VercelKVAdapter",
+    CloudProvider.BLOCKCHAIN: "BlockchainKVAdapter",
+}
+
+
+@lru_cache(maxsize=None)
+def _kv_adapter_class(provider: CloudProvider) -> type:
+    """Adapter class for a provider's NoSQL KV store (MongoDB for anything else)"""
+    name = _KV_ADAPTERS.get(provider, "MongoDBAdapter")
+    module = importlib.import_module(f".adapters.{name}", __package__)
+    return getattr(module, name)
+
+
+# First env var present (and non-empty) decides the provider, in this order
+_PROVIDER_ENV_RULES = (
+    ("AZURE_STORAGE_CONNECTION_STRING", CloudProvider.AZURE),
+    ("AWS_ACCESS_KEY_ID", CloudProvider.AWS),
+    ("GOOGLE_CLOUD_PROJECT", CloudProvider.GCP),
+    ("VERCEL_ENV", CloudProvider.VERCEL),
+)
+
+
+@lru_cache(maxsize=32)
+def _parse_provider(value: str) -> Optional[CloudProvider]:
+    try:
+        return CloudProvider(value.lower())
+    except ValueError:
+        return None
+
+
 # ============================================================
 # FACTORY
 # ============================================================
@@ -84,21 +121,17 @@ class CloudDatabaseFactory:
     # Provider detection (env fallback)
     # --------------------------------------------------------
     def _detect_provider(self) -> CloudProvider:
-        explicit = os.getenv("CLOUD_PROVIDER")
+        env = os.environ
+        explicit = env.get("CLOUD_PROVIDER")
         if explicit:
-            try:
-                return CloudProvider(explicit.lower())
-            except Exception:
-                self.logger.warning(f"Invalid CLOUD_PROVIDER: {explicit}")
-
-        if os.getenv("AZURE_STORAGE_CONNECTION_STRING"):
-            return CloudProvider.AZURE
-        if os.getenv("AWS_ACCESS_KEY_ID"):
-            return CloudProvider.AWS
-        if os.getenv("GOOGLE_CLOUD_PROJECT"):
-            return CloudProvider.GCP
-        if os.getenv("VERCEL_ENV"):
-            return CloudProvider.VERCEL
+            provider = _parse_provider(explicit)
+            if provider is not None:
+                return provider
+            self.logger.warning(f"Invalid CLOUD_PROVIDER: {explicit}")
+
+        for key, provider in _PROVIDER_ENV_RULES:
+            if env.get(key):
+                return provider
 
         return CloudProvider.POSTGRESQL
 
@@ -126,8 +159,6 @@ class CloudDatabaseFactory:
 
             # ---------------- AZURE ----------------
             if provider == CloudProvider.AZURE:
-                from .adapters.AzureBlobStorageAdapter import AzureBlobStorageAdapter
-
                 connection_string = None
                 container = None
 
@@ -142,14 +173,10 @@ class CloudDatabaseFactory:
 
             # ---------------- AWS / S3 ----------------
             elif provider in (CloudProvider.AWS, CloudProvider.S3_COMPATIBLE):
-                from .adapters.S3CompatibleAdapter import S3CompatibleAdapter
-
                 instance = S3CompatibleAdapter()
 
             # ---------------- GCP ----------------
             elif provider == CloudProvider.GCP:
-                from .adapters.GCPStorageAdapter import GCPStorageAdapter
-
                 bucket = None
                 project_id = ""
                 endpoint = None
@@ -164,8 +191,6 @@ class CloudDatabaseFactory:
 
             # ---------------- VERCEL ----------------
             elif provider == CloudProvider.VERCEL:
-                from .adapters.VercelBlobAdapter import VercelBlobAdapter
-
                 token = None
                 timeout = 10
 
@@ -177,8 +202,6 @@ class CloudDatabaseFactory:
 
             # ---------------- BLOCKCHAIN ----------------
             elif provider == CloudProvider.BLOCKCHAIN:
-                from .adapters.BlockchainBlobAdapter import BlockchainBlobAdapter
-
                 ipfs_url = None
                 if isinstance(cfg, BlockchainStorageConfig):
                     ipfs_url = cfg.ipfs_url
@@ -187,8 +210,6 @@ class CloudDatabaseFactory:
 
             # ---------------- DEFAULT ----------------
             else:
-                from .adapters.S3CompatibleAdapter import S3CompatibleAdapter
-
                 self.logger.warning(f"Fallback to S3-compatible for provider={provider}")
                 instance = S3CompatibleAdapter()
 
@@ -199,8 +220,6 @@ class CloudDatabaseFactory:
     # SQL
     # --------------------------------------------------------
     def get_sql(self, name: str = "sql"):
-        from .adapters.PostgreSQLAdapter import PostgreSQLAdapter
-
         with self._lock:
             if name in self.instances:
                 return self.instances[name]
@@ -229,10 +248,10 @@ class CloudDatabaseFactory:
             if not cfg:
                 cfg = StorageConfig(provider=self.provider, name=name)
 
+            adapter_cls = _kv_adapter_class(cfg.provider)
+
             # ---------------- AZURE TABLE ----------------
             if cfg.provider == CloudProvider.AZURE:
-                from .adapters.AzureTableStorageAdapter import AzureTableStorageAdapter
-
                 connection_string = ""
                 container_name = ""
 
@@ -241,7 +260,7 @@ class CloudDatabaseFactory:
                     table_name = cfg.table_name
                     container_name = cfg.container_name
 
-                instance = AzureTableStorageAdapter(
+                instance = adapter_cls(
                     partition_config=partition_config,
                     connection_string=connection_string,
                     container_name=container_name,
@@ -249,8 +268,6 @@ class CloudDatabaseFactory:
 
             # ---------------- AWS DYNAMODB ----------------
             elif cfg.provider == CloudProvider.AWS:
-                from .adapters.DynamoDBAdapter import DynamoDBAdapter
-
                 table_name = None
                 bucket_name = None
                 region = None
@@ -262,7 +279,7 @@ class CloudDatabaseFactory:
                     region = cfg.region
                     endpoint_url = cfg.endpoint_url
 
-                instance = DynamoDBAdapter(
+                instance = adapter_cls(
                     partition_config=partition_config,
                     table_name=table_name,
                     bucket_name=bucket_name,
@@ -272,8 +289,6 @@ class CloudDatabaseFactory:
 
             # ---------------- GCP FIRESTORE ----------------
             elif cfg.provider == CloudProvider.GCP:
-                from .adapters.FirestoreAdapter import FirestoreAdapter
-
                 project = None
                 bucket_name = None
 
@@ -281,7 +296,7 @@ class CloudDatabaseFactory:
                     project = cfg.project
                     bucket_name = cfg.bucket_name
 
-                instance = FirestoreAdapter(
+                instance = adapter_cls(
                     partition_config=partition_config,
                     project=project,
                     bucket_name=bucket_name,
@@ -289,8 +304,6 @@ class CloudDatabaseFactory:
 
             # ---------------- VERCEL KV ----------------
             elif cfg.provider == CloudProvider.VERCEL:
-                from .adapters.VercelKVAdapter import VercelKVAdapter
-
                 kv_url = ""
                 kv_token = ""
                 timeout = 10
@@ -300,7 +313,7 @@ class CloudDatabaseFactory:
                     kv_token = cfg.kv_token
                     timeout = cfg.timeout
 
-                instance = VercelKVAdapter(
+                instance = adapter_cls(
                     partition_config=partition_config,
                     kv_url=kv_url,
                     kv_token=kv_token,
@@ -309,8 +322,6 @@ class CloudDatabaseFactory:
 
             # ---------------- BLOCKCHAIN KV ----------------
             elif cfg.provider == CloudProvider.BLOCKCHAIN:
-                from .adapters.BlockchainKVAdapter import BlockchainKVAdapter
-
                 chain = None
                 rpc_url = None
                 private_key = None
@@ -324,7 +335,7 @@ class CloudDatabaseFactory:
                     contract_address = cfg.contract_address
                     contract_abi = cfg.contract_abi
 
-                instance = BlockchainKVAdapter(
+                instance = adapter_cls(
                     chain=chain,
                     rpc_url=rpc_url,
                     private_key=private_key,
@@ -334,8 +345,6 @@ class CloudDatabaseFactory:
 
             # ---------------- MONGODB ----------------
             else:
-                from .adapters.MongoDBAdapter import MongoDBAdapter
-
                 mongo_uri = ""
                 db_name = ""
 
@@ -343,7 +352,7 @@ class CloudDatabaseFactory:
                     mongo_uri = cfg.mongo_uri
                     db_name = cfg.db_name
 
-                instance = MongoDBAdapter(
+                instance = adapter_cls(
                     partition_config=partition_config,
                     mongo_uri=mongo_uri,
                     db_name=db_name,
@@ -377,8 +386,6 @@ class CloudDatabaseFactory:
                 instance = AzureQueueAdapter(connection_string or "")
 
             elif cfg.provider == CloudProvider.AWS:
-                from .adapters.SQSAdapter import SQSAdapter
-
                 queue_name = None
                 region = None
                 endpoint_url = None
@@ -461,8 +468,6 @@ class CloudDatabaseFactory:
 
             # ---------------- AZURE FILE STORAGE ----------------
             if cfg.provider == CloudProvider.AZURE:
-                from .adapters.AzureFileStorageAdapter import AzureFileStorageAdapter
-
                 connection_string = ""
                 share_name = ""
 
@@ -477,8 +482,6 @@ class CloudDatabaseFactory:
 
             # ---------------- AWS EFS ----------------
             elif cfg.provider == CloudProvider.AWS:
-                from .adapters.EFSAdapter import EFSAdapter
-
                 mount_point = None
                 if isinstance(cfg, EFSFileConfig):
                     mount_point = cfg.mount_path
@@ -489,8 +492,6 @@ class CloudDatabaseFactory:
 
             # ---------------- GCP STORAGE (FILES VIA BUCKET) ----------------
             elif cfg.provider == CloudProvider.GCP:
-                from .adapters.GCPStorageAdapter import GCPStorageAdapter
-
                 project_id = os.getenv("GOOGLE_CLOUD_PROJECT", "")
                 endpoint = os.getenv("GCP_STORAGE_ENDPOINT")  # optional (for emulator)
                 bucket = None
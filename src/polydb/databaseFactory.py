@@ -13,12 +13,18 @@ PolyDB is the dumb storage layer. UDL is the smart layer.
 from __future__ import annotations
 
 import logging
+import math
 import os
-from dataclasses import dataclass, field
-from datetime import datetime
+import random
+import time
+import uuid
+import weakref
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, Retrying, stop_after_attempt
 
 from .adapters.PostgreSQLAdapter import PostgreSQLAdapter
 
@@ -37,11 +43,34 @@ from .cloudDatabaseFactory import CloudDatabaseFactory
 
 logger = logging.getLogger(__name__)
 
-_DEFAULT_RETRY = retry(
-    wait=wait_exponential(multiplier=0.5, min=0.5, max=6),
-    stop=stop_after_attempt(3),
-    reraise=True,
-)
+
+def _polylog_wait(retry_state: RetryCallState) -> float:
+    """
+    Backoff growing as log²(attempt) rather than 2^attempt, capped at 6s,
+    with jitter so clients recovering from an outage don't retry in lockstep.
+    """
+    base = 0.5 * math.log2(retry_state.attempt_number + 1) ** 2
+    return min(6.0, base * random.uniform(0.75, 1.25))
+
+
+def _default_retrying() -> Retrying:
+    return Retrying(wait=_polylog_wait, stop=stop_after_attempt(3), reraise=True)
+
+
+# Last (epoch second, ISO string) pair, replaced as one tuple so readers never
+# see a second paired with another second's string
+_ISO_CACHE: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """UTC ISO-8601 timestamp at one-second resolution, formatted once per second."""
+    global _ISO_CACHE
+    s = int(time.time())
+    cached_s, iso = _ISO_CACHE
+    if cached_s != s:
+        iso = datetime.fromtimestamp(s, timezone.utc).replace(tzinfo=None).isoformat()
+        _ISO_CACHE = (s, iso)
+    return iso
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -95,34 +124,97 @@ class _ResolvedAdapters:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# Default for dynamic/string models (frozen, so one shared instance is safe)
+_DEFAULT_META = ModelMeta(storage="nosql", table=None, collection=None)
+
+# model class -> (__polydb__ dict it was built from, ModelMeta); weak so the
+# cache neither pins classes nor outlives them
+_META_CACHE: "weakref.WeakKeyDictionary[type, Tuple[Any, ModelMeta]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def _extract_meta(model: Union[type, str]) -> ModelMeta:
     """
     Extract storage metadata from model class.
 
     If model is a string, return a default NoSQL meta (UDL resolves the
     class before calling PolyDB, so string fallback is safe).
+
+    Cached per model while ``__polydb__`` is the same object, so assigning a
+    new dict (decorated or not) is picked up on the next call.
     """
-    if isinstance(model, type):
-        raw = getattr(model, "__polydb__", None)
-        if raw:
-            return ModelMeta(
-                storage=raw.get("storage", "nosql"),
-                table=raw.get("table"),
-                collection=raw.get("collection"),
-                pk_field=raw.get("pk_field", raw.get("partition_key")),
-                rk_field=raw.get("rk_field", raw.get("sort_key")),
-                provider=raw.get("provider"),
-                cache=raw.get("cache", False),
-                cache_ttl=raw.get("cache_ttl"),
-            )
-    # Default for dynamic/string models
-    return ModelMeta(storage="nosql", table=None, collection=None)
+    if not isinstance(model, type):
+        return _DEFAULT_META
+
+    raw = getattr(model, "__polydb__", None)
+    cached = _META_CACHE.get(model)
+    if cached is not None and cached[0] is raw:
+        return cached[1]
+
+    if raw:
+        meta = ModelMeta(
+            storage=raw.get("storage", "nosql"),
+            table=raw.get("table"),
+            collection=raw.get("collection"),
+            pk_field=raw.get("pk_field", raw.get("partition_key")),
+            rk_field=raw.get("rk_field", raw.get("sort_key")),
+            provider=raw.get("provider"),
+            cache=raw.get("cache", False),
+            cache_ttl=raw.get("cache_ttl"),
+            encrypted_fields=tuple(raw.get("encrypted_fields") or ()),
+        )
+    else:
+        meta = _DEFAULT_META
+    _META_CACHE[model] = (raw, meta)
+    return meta
 
 
 def _model_name(model: Union[type, str]) -> str:
     return model.__name__ if isinstance(model, type) else str(model)
 
 
+def _compute_field_changes(before: JsonDict, after: JsonDict) -> Optional[List[str]]:
+    """
+    Keys whose values differ between two row snapshots, or None if none do.
+
+    A missing key reads as None, so a key that is None on one side and absent
+    on the other is not a change.
+    """
+    changed = [k for k, v in before.items() if after.get(k) != v]
+    # Same key set and no diff so far: nothing is after-only (the common
+    # unchanged-row case skips the second walk)
+    if not changed and after.keys() == before.keys():
+        return None
+    changed.extend(k for k, v in after.items() if k not in before and v is not None)
+    return changed or None
+
+
+def _row_tenant(row: Optional[Any]) -> Optional[str]:
+    """The row's (or equality filter's) scalar ``tenant_id``, if it has one."""
+    if not isinstance(row, dict):
+        return None
+    tenant_id = row.get("tenant_id")
+    return tenant_id if isinstance(tenant_id, str) and tenant_id else None
+
+
+# Runtime classes synthesized for string model names, built once per name
+_RUNTIME_MODELS: Dict[str, Tuple[ModelMeta, type]] = {}
+
+
+def _runtime_model(model: Union[type, str], meta: ModelMeta) -> type:
+    """Class handed to NoSQL adapters (string models get a cached synthesized class)."""
+    if isinstance(model, type):
+        return model
+    name = str(model)
+    cached = _RUNTIME_MODELS.get(name)
+    if cached is not None and cached[0] == meta:
+        return cached[1]
+    cls = type(name, (), {"__polydb__": asdict(meta)})
+    _RUNTIME_MODELS[name] = (meta, cls)
+    return cls
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATABASE FACTORY
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -140,6 +232,29 @@ class DatabaseFactory:
     UDL handles all of that.
     """
 
+    __slots__ = (
+        "_enable_retries",
+        "_retrying",
+        "_idempotency_field",
+        "_enable_audit",
+        "_enable_audit_reads",
+        "_enable_cache",
+        "_soft_delete",
+        "_base_read_filter",
+        "metrics",
+        "health",
+        "_cache",
+        "cache_warmer",
+        "encryption",
+        "masking",
+        "batch",
+        "_audit",
+        "_engines",
+        "_engine_by_name",
+        "_provider_name",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
@@ -151,19 +266,35 @@ class DatabaseFactory:
         # Feature flags
         redis_cache_url: Optional[str] = None,
         enable_retries: bool = True,
+        idempotency_field: Optional[str] = None,
         enable_audit: bool = True,
         enable_audit_reads: bool = False,
+        audit_before_snapshots: bool = True,
+        async_audit: bool = False,
         enable_cache: bool = True,
         soft_delete: bool = False,
         use_redis_cache: bool = False,
         enable_monitoring: bool = False,
         enable_encryption: bool = False,
     ) -> None:
+        """
+        idempotency_field: column/attribute that create() and upsert() stamp with
+        a per-call UUID before the retry loop, for at-most-once inserts. It is
+        written for every model, so every SQL table (and NoSQL store) routed
+        through this factory must have the column, with a unique index. When an
+        insert fails, the row carrying the key is looked up; if an earlier
+        attempt committed it, that row is returned instead of raising. The field
+        is stripped from returned rows. Off (None) by default.
+        """
         self._enable_retries = enable_retries
+        self._retrying = _default_retrying()
+        self._idempotency_field = idempotency_field
         self._enable_audit = enable_audit
         self._enable_audit_reads = enable_audit_reads
         self._enable_cache = enable_cache
         self._soft_delete = soft_delete
+        # Static filter fragment merged under every non-deleted read
+        self._base_read_filter: Lookup = {"deleted_at": None} if soft_delete else {}
 
         # Monitoring
         self.metrics = MetricsCollector() if enable_monitoring else None
@@ -185,7 +316,11 @@ class DatabaseFactory:
         self.masking = DataMasking()
 
         self.batch = BatchOperations(self)
-        self._audit = AuditManager() if enable_audit else None
+        self._audit = (
+            AuditManager(records_before=audit_before_snapshots, async_writes=async_audit)
+            if enable_audit
+            else None
+        )
 
         # Engine registry
         self._engines: List[EngineConfig] = []
@@ -304,8 +439,11 @@ class DatabaseFactory:
 
     def _inject_audit_fields(self, data: JsonDict, is_create: bool = False) -> JsonDict:
         data = dict(data)
+        if is_create and self._idempotency_field:
+            # Assigned before the retry loop so every attempt carries the same key
+            data.setdefault(self._idempotency_field, uuid.uuid4().hex)
         actor_id = AuditContext.actor_id.get()
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         if is_create:
             data.setdefault("created_at", now)
             if actor_id:
@@ -315,12 +453,58 @@ class DatabaseFactory:
             data.setdefault("updated_by", actor_id)
         return data
 
+    def _invalidate_cache(self, name: str, *rows: Optional[JsonDict]) -> None:
+        """
+        Drop cached reads of ``name`` after a write touching ``rows``.
+
+        When every row belongs to the same tenant, only that tenant's slice and
+        the unscoped entries are dropped. Rows without a tenant, from several
+        tenants, or unknown (None) drop the whole model.
+        """
+        if not (self._enable_cache and self._cache):
+            return
+        tenants = {_row_tenant(row) for row in rows}
+        tenant_id = tenants.pop() if len(tenants) == 1 else None
+        if tenant_id:
+            self._cache.invalidate(name, tenant_id=tenant_id)
+        else:
+            self._cache.invalidate(name)
+
+    def _find_idempotent_write(
+        self,
+        model: Union[type, str],
+        meta: ModelMeta,
+        adapters: _ResolvedAdapters,
+        data: JsonDict,
+        engine_override: Optional[EngineOverride] = None,
+    ) -> Optional[JsonDict]:
+        """Stored (raw) row carrying ``data``'s idempotency key, if one was committed."""
+        field = self._idempotency_field
+        if not field or data.get(field) is None:
+            return None
+        lookup = {field: data[field]}
+        try:
+            if self._is_sql(meta, engine_override):
+                rows = adapters.sql.select(meta.table, lookup, limit=1)
+            else:
+                rows = adapters.nosql.query(
+                    _runtime_model(model, meta), query=lookup, limit=1, no_cache=True
+                )
+        except Exception:
+            return None
+        return rows[0] if rows else None
+
+    def _strip_idempotency_key(self, row: JsonDict) -> JsonDict:
+        if self._idempotency_field not in row:
+            return row
+        return {k: v for k, v in row.items() if k != self._idempotency_field}
+
     def _apply_soft_delete_filter(self, query: Optional[Lookup]) -> Lookup:
-        if not self._soft_delete:
+        if not self._base_read_filter:
             return query or {}
-        result = dict(query or {})
-        result.setdefault("deleted_at", None)
-        return result
+        if not query:
+            return self._base_read_filter.copy()
+        return {**self._base_read_filter, **query}
 
     def _audit_safe(
         self,
@@ -338,11 +522,7 @@ class DatabaseFactory:
         if not self._audit:
             return
         try:
-            changed = None
-            if before and after:
-                changed = [
-                    k for k in set(before) | set(after) if before.get(k) != after.get(k)
-                ] or None
+            changed = _compute_field_changes(before, after) if before and after else None
             self._audit.record(
                 action=action,
                 model=_model_name(model),
@@ -358,10 +538,65 @@ class DatabaseFactory:
         except Exception as exc:
             logger.error("Audit recording failed: %s", exc)
 
-    def _run(self, fn: Callable[[], Any]) -> Any:
-        if not self._enable_retries:
-            return fn()
-        return _DEFAULT_RETRY(fn)()
+    def _monitor(self, operation: str, name: str) -> Any:
+        """PerformanceMonitor when monitoring is enabled, else a no-op context."""
+        if self.metrics:
+            return PerformanceMonitor(self.metrics, operation, name, None)
+        return nullcontext()
+
+    def _records_before(self) -> bool:
+        """Whether audit records consume the pre-write snapshot."""
+        return bool(self._audit and self._audit.records_before)
+
+    def _fetch_before(
+        self,
+        model: Union[type, str],
+        entity_id: Union[Any, Lookup],
+        engine_override: Optional[EngineOverride],
+    ) -> Optional[JsonDict]:
+        """Pre-write snapshot: read path without cache or metrics (internal read)."""
+        meta = _extract_meta(model)
+        adapters = self._adapters_for(model, meta, engine_override)
+        lookup = {"id": entity_id} if not isinstance(entity_id, dict) else entity_id
+        rows = self._run(
+            self._read_rows,
+            model,
+            meta,
+            adapters,
+            lookup,
+            limit=1,
+            no_cache=True,
+            engine_override=engine_override,
+        )
+        return rows[0] if rows else None
+
+    def _read_rows(
+        self,
+        model: Union[type, str],
+        meta: ModelMeta,
+        adapters: _ResolvedAdapters,
+        query: Optional[Lookup],
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        no_cache: bool = False,
+        engine_override: Optional[EngineOverride] = None,
+    ) -> List[JsonDict]:
+        """Fetch and decrypt rows from the routed engine."""
+        if self._is_sql(meta, engine_override):
+            raw = adapters.sql.select(meta.table, query, limit=limit, offset=offset)
+        else:
+            raw = adapters.nosql.query(
+                _runtime_model(model, meta), query=query, limit=limit, no_cache=no_cache
+            )
+        if self.encryption and meta.encrypted_fields:
+            raw = self.encryption.decrypt_fields_batch(raw, meta.encrypted_fields, copy=False)
+        return raw
+
+    def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self._enable_retries:
+            return self._retrying(fn, *args, **kwargs)
+        return fn(*args, **kwargs)
 
     def _is_sql(self, meta: ModelMeta, override: Optional[EngineOverride] = None) -> bool:
         if override and override.force_sql:
@@ -385,9 +620,10 @@ class DatabaseFactory:
         name = _model_name(model)
         data = self._inject_audit_fields(data, is_create=True)
 
-        encrypted_fields = getattr(meta, "encrypted_fields", [])
+        encrypted_fields = meta.encrypted_fields
         if self.encryption and encrypted_fields:
-            data = self.encryption.encrypt_fields(data, encrypted_fields)
+            # data is already a private copy from _inject_audit_fields
+            data = self.encryption.encrypt_fields(data, encrypted_fields, copy=False)
 
         adapters = self._adapters_for(model, meta, engine_override)
         after_plain = None
@@ -397,24 +633,26 @@ class DatabaseFactory:
 
         def _op() -> JsonDict:
             nonlocal after_plain, success, entity_id
-            if self._is_sql(meta, engine_override):
-                result = adapters.sql.insert(meta.table, data)
-            else:
-                result = adapters.nosql.put(
-                    (
-                        model
-                        if isinstance(model, type)
-                        else type(name, (), {"__polydb__": meta.__dict__})
-                    ),
-                    data,
-                )
+            try:
+                if self._is_sql(meta, engine_override):
+                    result = adapters.sql.insert(meta.table, data)
+                else:
+                    result = adapters.nosql.put(_runtime_model(model, meta), data)
+            except Exception:
+                # A previous attempt may have committed before its response was
+                # lost, making this one collide on the unique idempotency key
+                existing = self._find_idempotent_write(model, meta, adapters, data, engine_override)
+                if existing is None:
+                    raise
+                result = existing
             entity_id = result.get("id")
             after_plain = result
             if self.encryption and encrypted_fields:
-                after_plain = self.encryption.decrypt_fields(result, encrypted_fields)
+                after_plain = self.encryption.decrypt_fields(result, encrypted_fields, copy=False)
+            if self._idempotency_field:
+                after_plain = self._strip_idempotency_key(after_plain)
             success = True
-            if self._enable_cache and self._cache:
-                self._cache.invalidate(name)
+            self._invalidate_cache(name, result)
             return after_plain
 
         try:
@@ -466,41 +704,37 @@ class DatabaseFactory:
             query = self._apply_soft_delete_filter(query)
 
         adapters = self._adapters_for(model, meta, engine_override)
-        use_external_cache = self._enable_cache and self._cache and getattr(meta, "cache", False)
-        encrypted_fields = getattr(meta, "encrypted_fields", [])
+        use_external_cache = self._enable_cache and self._cache and meta.cache
+        # Only reads filtered to one tenant are cached in that tenant's slice; their
+        # rows cannot change on another tenant's write
+        tenant_id = _row_tenant(query)
 
-        def _op() -> List[JsonDict]:
-            if self._is_sql(meta, engine_override):
-                raw = adapters.sql.select(meta.table, query, limit=limit, offset=offset)
-            else:
-                cls = (
-                    model
-                    if isinstance(model, type)
-                    else type(name, (), {"__polydb__": meta.__dict__})
-                )
-                raw = adapters.nosql.query(
-                    cls, query=query, limit=limit, no_cache=no_cache or bool(use_external_cache)
-                )
-            if self.encryption and encrypted_fields:
-                raw = [self.encryption.decrypt_fields(r, encrypted_fields) for r in raw]
-            if self._cache and use_external_cache and not no_cache:
-                ttl = cache_ttl or getattr(meta, "cache_ttl", 300)
-                self._cache.set(name, query or {}, raw, ttl)
-            return raw
+        cacheable = bool(self._cache and use_external_cache and not no_cache)
 
         # Check external cache first
-        if self._cache and use_external_cache and not no_cache:
-            cached = self._cache.get(name, query or {})
+        if cacheable:
+            cached = self._cache.get(name, query or {}, tenant_id=tenant_id)
             if cached is not None:
                 return cached
 
-        monitor = PerformanceMonitor(self.metrics, "read", name, None) if self.metrics else None
-        if monitor:
-            with monitor as m:
-                rows = self._run(_op)
+        with self._monitor("read", name) as m:
+            rows = self._run(
+                self._read_rows,
+                model,
+                meta,
+                adapters,
+                query,
+                limit=limit,
+                offset=offset,
+                no_cache=no_cache or bool(use_external_cache),
+                engine_override=engine_override,
+            )
+            if cacheable:
+                ttl = cache_ttl or meta.cache_ttl
+                self._cache.set(name, query or {}, rows, ttl, tenant_id=tenant_id)
+            if m:
                 m.rows_returned = len(rows)
-                return rows
-        return self._run(_op)
+        return rows
 
     def read_one(
         self,
@@ -539,17 +773,21 @@ class DatabaseFactory:
         meta = _extract_meta(model)
         data = self._inject_audit_fields(data, is_create=False)
 
-        encrypted_fields = getattr(meta, "encrypted_fields", [])
+        encrypted_fields = meta.encrypted_fields
         if self.encryption and encrypted_fields:
-            data = self.encryption.encrypt_fields(data, [f for f in encrypted_fields if f in data])
+            data = self.encryption.encrypt_fields(
+                data, [f for f in encrypted_fields if f in data], copy=False
+            )
 
         adapters = self._adapters_for(model, meta, engine_override)
-        before = self.read_one(
-            model,
-            {"id": entity_id} if not isinstance(entity_id, dict) else entity_id,
-            no_cache=True,
-            include_deleted=True,
-            engine_override=engine_override,
+        # NoSQL patches fall back to the stored row for the partition key
+        needs_pk_lookup = not self._is_sql(meta, engine_override) and not (
+            data.get("PartitionKey") or data.get("partition_key") or data.get("pk")
+        )
+        before = (
+            self._fetch_before(model, entity_id, engine_override)
+            if needs_pk_lookup or self._records_before()
+            else None
         )
         after_plain = None
         success = False
@@ -575,23 +813,24 @@ class DatabaseFactory:
                             or en_id.get("pk")
                         )
                         if not en_pk:
-                            en_id["partition_key"] = pkey
+                            en_id = {**en_id, "partition_key": pkey}
                     elif isinstance(en_id, str):
                         en_id = {"partition_key": pkey, "id": entity_id}
 
-                cls = (
-                    model
-                    if isinstance(model, type)
-                    else type(name, (), {"__polydb__": meta.__dict__})
-                )
+                cls = _runtime_model(model, meta)
 
                 result = adapters.nosql.patch(cls, en_id, data, etag=etag, replace=replace)
             after_plain = result
             if self.encryption and encrypted_fields:
-                after_plain = self.encryption.decrypt_fields(result, encrypted_fields)
+                after_plain = self.encryption.decrypt_fields(result, encrypted_fields, copy=False)
+            if self._idempotency_field:
+                after_plain = self._strip_idempotency_key(after_plain)
             success = True
-            if self._enable_cache and self._cache:
-                self._cache.invalidate(name)
+            prior = before
+            if prior is None and "tenant_id" not in data:
+                # The patch leaves tenant_id alone, so the row stayed in its tenant
+                prior = result
+            self._invalidate_cache(name, result, prior)
             return after_plain
 
         try:
@@ -636,9 +875,10 @@ class DatabaseFactory:
         meta = _extract_meta(model)
         data = self._inject_audit_fields(data, is_create=True)
 
-        encrypted_fields = getattr(meta, "encrypted_fields", [])
+        encrypted_fields = meta.encrypted_fields
         if self.encryption and encrypted_fields:
-            data = self.encryption.encrypt_fields(data, encrypted_fields)
+            # data is already a private copy from _inject_audit_fields
+            data = self.encryption.encrypt_fields(data, encrypted_fields, copy=False)
 
         adapters = self._adapters_for(model, meta, engine_override)
         after_plain = None
@@ -650,18 +890,16 @@ class DatabaseFactory:
             if self._is_sql(meta, engine_override):
                 result = adapters.sql.upsert(meta.table, data)
             else:
-                cls = (
-                    model
-                    if isinstance(model, type)
-                    else type(name, (), {"__polydb__": meta.__dict__})
-                )
+                cls = _runtime_model(model, meta)
                 result = adapters.nosql.upsert(cls, data, replace=replace)
             after_plain = result
             if self.encryption and encrypted_fields:
-                after_plain = self.encryption.decrypt_fields(result, encrypted_fields)
+                after_plain = self.encryption.decrypt_fields(result, encrypted_fields, copy=False)
+            if self._idempotency_field:
+                after_plain = self._strip_idempotency_key(after_plain)
             success = True
-            if self._enable_cache and self._cache:
-                self._cache.invalidate(name)
+            # The replaced row's tenant is unknown
+            self._invalidate_cache(name, None)
             return after_plain
 
         try:
@@ -711,19 +949,17 @@ class DatabaseFactory:
                 model,
                 entity_id,
                 {
-                    "deleted_at": datetime.utcnow().isoformat(),
+                    "deleted_at": _now_iso(),
                     "deleted_by": AuditContext.actor_id.get(),
                 },
                 engine_override=engine_override,
             )
 
         adapters = self._adapters_for(model, meta, engine_override)
-        before = self.read_one(
-            model,
-            {"id": entity_id} if not isinstance(entity_id, dict) else entity_id,
-            no_cache=True,
-            include_deleted=True,
-            engine_override=engine_override,
+        before = (
+            self._fetch_before(model, entity_id, engine_override)
+            if self._records_before()
+            else None
         )
         success = False
         error: Optional[str] = None
@@ -733,15 +969,10 @@ class DatabaseFactory:
             if self._is_sql(meta, engine_override):
                 result = adapters.sql.delete(meta.table, entity_id)
             else:
-                cls = (
-                    model
-                    if isinstance(model, type)
-                    else type(name, (), {"__polydb__": meta.__dict__})
-                )
+                cls = _runtime_model(model, meta)
                 result = adapters.nosql.delete(cls, entity_id, etag=etag)
             success = True
-            if self._enable_cache and self._cache:
-                self._cache.invalidate(name)
+            self._invalidate_cache(name, before)
             return result
 
         try:
@@ -785,24 +1016,14 @@ class DatabaseFactory:
         meta = _extract_meta(model)
         adapters = self._adapters_for(model, meta, engine_override)
 
-        def _op():
+        with self._monitor("query_linq", name) as m:
             if self._is_sql(meta, engine_override):
-                return adapters.sql.query_linq(meta.table, builder)
-            cls = (
-                model if isinstance(model, type) else type(name, (), {"__polydb__": meta.__dict__})
-            )
-            return adapters.nosql.query_linq(cls, builder)
-
-        monitor = (
-            PerformanceMonitor(self.metrics, "query_linq", name, None) if self.metrics else None
-        )
-        if monitor:
-            with monitor as m:
-                result = self._run(_op)
-                if isinstance(result, list):
-                    m.rows_returned = len(result)
-                return result
-        return self._run(_op)
+                result = self._run(adapters.sql.query_linq, meta.table, builder)
+            else:
+                result = self._run(adapters.nosql.query_linq, _runtime_model(model, meta), builder)
+            if m and isinstance(result, list):
+                m.rows_returned = len(result)
+        return result
 
     # ──────────────────────────────────────────────────────────────────────
     # PAGINATION
@@ -825,33 +1046,25 @@ class DatabaseFactory:
             query = self._apply_soft_delete_filter(query)
 
         adapters = self._adapters_for(model, meta, engine_override)
-        encrypted_fields = getattr(meta, "encrypted_fields", [])
 
-        def _op() -> Tuple[List[JsonDict], Optional[str]]:
+        with self._monitor("read_page", name) as m:
             if self._is_sql(meta, engine_override):
-                raw, token = adapters.sql.select_page(
-                    meta.table, query, page_size, continuation_token
+                raw, token = self._run(
+                    adapters.sql.select_page, meta.table, query, page_size, continuation_token
                 )
             else:
-                cls = (
-                    model
-                    if isinstance(model, type)
-                    else type(name, (), {"__polydb__": meta.__dict__})
+                raw, token = self._run(
+                    adapters.nosql.query_page,
+                    _runtime_model(model, meta),
+                    query,
+                    page_size,
+                    continuation_token,
                 )
-                raw, token = adapters.nosql.query_page(cls, query, page_size, continuation_token)
-            if self.encryption and encrypted_fields:
-                raw = [self.encryption.decrypt_fields(r, encrypted_fields) for r in raw]
-            return raw, token
-
-        monitor = (
-            PerformanceMonitor(self.metrics, "read_page", name, None) if self.metrics else None
-        )
-        if monitor:
-            with monitor as m:
-                result = self._run(_op)
-                m.rows_returned = len(result[0])
-                return result
-        return self._run(_op)
+            if self.encryption and meta.encrypted_fields:
+                raw = self.encryption.decrypt_fields_batch(raw, meta.encrypted_fields, copy=False)
+            if m:
+                m.rows_returned = len(raw)
+        return raw, token
 
     # ══════════════════════════════════════════════════════════════════════
     # BLOB STORAGE
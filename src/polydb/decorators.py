@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Type, TypeVar
 
 from .registry import ModelRegistry
+from .validation import ModelValidator
 
 T = TypeVar("T", bound=type)
 
@@ -18,4 +19,6 @@ def polydb_model(cls: T) -> T:
             __polydb__ = {"storage": "nosql"}
     """
     ModelRegistry.register(cls)
+    # Validate once at registration; later validate_model calls are cache hits
+    ModelValidator.validate_model(cls)
     return cls
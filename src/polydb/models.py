@@ -21,7 +21,7 @@ class CloudProvider(Enum):
     BLOCKCHAIN = "blockchain"
 
 
-@dataclass
+@dataclass(slots=True)
 class PartitionConfig:
     """Configuration for partition and row keys"""
 
@@ -31,7 +31,7 @@ class PartitionConfig:
     auto_generate: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryOptions:
     """LINQ-style query options"""
 
@@ -2,8 +2,10 @@
 """
 Multi-tenancy enforcement and isolation
 """
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Mapping, Optional, Callable, Tuple
 from contextvars import ContextVar
+from types import MappingProxyType
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -15,7 +17,7 @@ class IsolationLevel(Enum):
     SEPARATE_DATABASE = "database"  # Separate DB per tenant
 
 
-@dataclass
+@dataclass(slots=True)
 class TenantConfig:
     """Tenant configuration"""
     tenant_id: str
@@ -31,19 +33,24 @@ class TenantRegistry:
     """Registry of tenant configurations"""
     
     def __init__(self):
-        self._tenants: Dict[str, TenantConfig] = {}
+        # Copy-on-write snapshot: readers never lock, writers swap the whole mapping
+        self._snapshot: Mapping[str, TenantConfig] = MappingProxyType({})
+        self._write_lock = threading.Lock()
     
     def register(self, config: TenantConfig):
         """Register tenant"""
-        self._tenants[config.tenant_id] = config
+        with self._write_lock:
+            tenants = dict(self._snapshot)
+            tenants[config.tenant_id] = config
+            self._snapshot = MappingProxyType(tenants)
     
     def get(self, tenant_id: str) -> Optional[TenantConfig]:
         """Get tenant config"""
-        return self._tenants.get(tenant_id)
+        return self._snapshot.get(tenant_id)
     
     def list_all(self) -> List[TenantConfig]:
         """List all tenants"""
-        return list(self._tenants.values())
+        return list(self._snapshot.values())
 
 
 class TenantContext:
@@ -77,13 +84,16 @@ class TenantIsolationEnforcer:
     
     def __init__(self, registry: TenantRegistry):
         self.registry = registry
+        # (tenant_id, base_table) -> (config it was built from, qualified name)
+        self._name_cache: Dict[Tuple[str, str], Tuple[TenantConfig, str]] = {}
     
     def enforce_read(
         self,
         model: str,
-        query: Dict[str, Any]
+        query: Dict[str, Any],
+        in_place: bool = False
     ) -> Dict[str, Any]:
-        """Enforce tenant isolation on read"""
+        """Enforce tenant isolation on read (in_place: add the filter to ``query`` itself)"""
         tenant = TenantContext.get_tenant()
         
         if not tenant:
@@ -91,7 +101,8 @@ class TenantIsolationEnforcer:
         
         if tenant.isolation_level == IsolationLevel.SHARED_SCHEMA:
             # Add tenant_id filter
-            query = query.copy()
+            if not in_place:
+                query = query.copy()
             query['tenant_id'] = tenant.tenant_id
         
         return query
@@ -99,9 +110,15 @@ class TenantIsolationEnforcer:
     def enforce_write(
         self,
         model: str,
-        data: Dict[str, Any]
+        data: Dict[str, Any],
+        in_place: bool = False
     ) -> Dict[str, Any]:
-        """Enforce tenant isolation on write"""
+        """
+        Enforce tenant isolation on write.
+        
+        Bulk writers that own their row dicts pass ``in_place=True`` to skip
+        the per-row copy.
+        """
         tenant = TenantContext.get_tenant()
         
         if not tenant:
@@ -109,7 +126,8 @@ class TenantIsolationEnforcer:
         
         if tenant.isolation_level == IsolationLevel.SHARED_SCHEMA:
             # Add tenant_id
-            data = data.copy()
+            if not in_place:
+                data = data.copy()
             data['tenant_id'] = tenant.tenant_id
         
         return data
@@ -121,12 +139,29 @@ class TenantIsolationEnforcer:
         if not tenant:
             raise ValueError("No tenant context set")
         
+        if tenant.isolation_level == IsolationLevel.SHARED_SCHEMA:
+            return base_table
+        
+        key = (tenant.tenant_id, base_table)
+        cached = self._name_cache.get(key)
+        # Re-registering a tenant installs a new config object, which misses here
+        if cached is not None and cached[0] is tenant:
+            return cached[1]
+        
         if tenant.isolation_level == IsolationLevel.SEPARATE_SCHEMA:
-            return f"{tenant.schema_name}.{base_table}"
+            name = f"{tenant.schema_name}.{base_table}"
         elif tenant.isolation_level == IsolationLevel.SEPARATE_DATABASE:
-            return f"{tenant.database_name}.public.{base_table}"
+            name = f"{tenant.database_name}.public.{base_table}"
         else:
-            return base_table
+            name = base_table
+        
+        self._name_cache[key] = (tenant, name)
+        return name
+    
+    def invalidate(self, tenant_id: str):
+        """Drop cached table names for a tenant"""
+        for key in [k for k in self._name_cache if k[0] == tenant_id]:
+            self._name_cache.pop(key, None)
 
 
 class TenantQuotaManager:
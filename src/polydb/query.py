@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from enum import Enum
 
 
@@ -20,14 +21,227 @@ class Operator(Enum):
     ENDS_WITH = "ends_with"
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryFilter:
     field: str
     operator: Operator
     value: Any
 
 
-@dataclass
+# ------------------------------------------------
+# COMPILED IN-MEMORY PREDICATES
+# ------------------------------------------------
+
+# Failure test per operator; {v} is the row value, {c} the filter literal
+_PREDICATE_TESTS = {
+    Operator.EQ: "{v} != {c}",
+    Operator.NE: "{v} == {c}",
+    Operator.GT: "not ({v} and {v} > {c})",
+    Operator.GTE: "not ({v} and {v} >= {c})",
+    Operator.LT: "not ({v} and {v} < {c})",
+    Operator.LTE: "not ({v} and {v} <= {c})",
+    Operator.CONTAINS: "not {v} or {c} not in str({v})",
+    Operator.STARTS_WITH: "not {v} or not str({v}).startswith({c})",
+    Operator.ENDS_WITH: "not {v} or not str({v}).endswith({c})",
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable, type-tagged form of a filter literal (raises TypeError if impossible)"""
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+class _Literal:
+    """Filter value wrapper that hashes by content, for QueryBuilder.signature()"""
+
+    __slots__ = ("value", "_key")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self._key = _freeze(value)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Literal) and self._key == other._key
+
+
+# Container types whose IN/NOT_IN members are frozen into a set when hashable
+_MEMBER_CONTAINERS = (list, tuple, set, frozenset)
+
+
+@lru_cache(maxsize=1024)
+def _compile_predicate(shape: tuple) -> Callable[..., Callable[[Dict[str, Any]], bool]]:
+    """
+    Predicate factory for a filter shape of (field, operator, kind) entries.
+
+    The factory takes the filter values positionally (IN/NOT_IN of kind "set"
+    take the frozen members, then the original container) and returns the row
+    predicate with those values bound as closure constants.
+    """
+    params: List[str] = []
+    body = ["    def pred(it):", "        get = it.get"]
+
+    for i, (field_name, operator, kind) in enumerate(shape):
+        v, c = f"v{i}", f"c{i}"
+        body.append(f"        {v} = get({field_name!r})")
+
+        if operator in (Operator.IN, Operator.NOT_IN):
+            test = "in" if operator == Operator.NOT_IN else "not in"
+            if kind == "set":
+                # O(1) membership; unhashable row values fall back to the original container
+                params += [c, f"{c}_seq"]
+                body.append("        try:")
+                body.append(f"            if {v} {test} {c}: return False")
+                body.append("        except TypeError:")
+                body.append(f"            if {v} {test} {c}_seq: return False")
+            else:
+                params.append(c)
+                body.append(f"        if {v} {test} {c}: return False")
+            continue
+
+        params.append(c)
+        test = _PREDICATE_TESTS[operator].format(v=v, c=c)
+        body.append(f"        if {test}: return False")
+
+    body.append("        return True")
+    lines = [f"def make({', '.join(params)}):", *body, "    return pred"]
+    ns: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<polydb-predicate>", "exec"), ns)
+    return ns["make"]
+
+
+def compile_filters(
+    filters: Sequence["QueryFilter"],
+) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Compile filters into a straight-line row predicate.
+
+    Code is generated once per filter shape (field, operator, value kind) and
+    the values are bound per call, so queries that differ only in their
+    arguments share one compile. Returns None when a filter's operator is not
+    an Operator (callers fall back to interpreting the filters).
+    """
+    shape = []
+    args: List[Any] = []
+    for f in filters:
+        if not isinstance(f.operator, Operator):
+            return None
+        kind = None
+        if f.operator in (Operator.IN, Operator.NOT_IN):
+            kind = "seq"
+            if isinstance(f.value, _MEMBER_CONTAINERS):
+                try:
+                    args.append(frozenset(f.value))
+                    kind = "set"
+                except TypeError:
+                    pass
+        shape.append((f.field, f.operator, kind))
+        args.append(f.value)
+    return _compile_predicate(tuple(shape))(*args)
+
+
+def _filter_signature(filters: Sequence["QueryFilter"]) -> Optional[tuple]:
+    try:
+        return tuple((f.field, f.operator, _Literal(f.value)) for f in filters)
+    except TypeError:
+        return None
+
+
+# ------------------------------------------------
+# OPERATOR DISPATCH
+# ------------------------------------------------
+
+_SQL_SCALAR = {
+    Operator.EQ: "{} = %s",
+    Operator.NE: "{} != %s",
+    Operator.GT: "{} > %s",
+    Operator.GTE: "{} >= %s",
+    Operator.LT: "{} < %s",
+    Operator.LTE: "{} <= %s",
+}
+
+_SQL_LIST = {Operator.IN: "IN", Operator.NOT_IN: "NOT IN"}
+
+# LIKE patterns wrapping the filter value
+_SQL_LIKE = {
+    Operator.CONTAINS: "%{}%",
+    Operator.STARTS_WITH: "{}%",
+    Operator.ENDS_WITH: "%{}",
+}
+
+# Operators without an entry are not expressible as a NoSQL filter key
+_NOSQL_SUFFIX = {
+    Operator.EQ: "",
+    Operator.IN: "__in",
+    Operator.GT: "__gt",
+    Operator.GTE: "__gte",
+    Operator.LT: "__lt",
+    Operator.LTE: "__lte",
+    Operator.CONTAINS: "__contains",
+}
+
+
+# Extractor marker: the filter value is a sequence spliced into the params
+_EXTEND = object()
+
+
+def _sql_shape(f: QueryFilter) -> tuple:
+    """(field, operator, placeholder count); count is -1 unless the value is a list"""
+    if f.operator == Operator.NOT_IN or (
+        f.operator == Operator.IN and isinstance(f.value, (list, tuple))
+    ):
+        return (f.field, f.operator, len(f.value))
+    return (f.field, f.operator, -1)
+
+
+@lru_cache(maxsize=1024)
+def _compile_sql_where(shape: tuple) -> tuple[str, tuple]:
+    """WHERE text plus one param extractor per filter (None, _EXTEND or a LIKE pattern)"""
+    clauses = []
+    extractors: List[Any] = []
+
+    for field_name, op, count in shape:
+        template = _SQL_SCALAR.get(op)
+
+        if template is not None:
+            clauses.append(template.format(field_name))
+            extractors.append(None)
+
+        elif op in _SQL_LIKE:
+            clauses.append(f"{field_name} LIKE %s")
+            extractors.append(_SQL_LIKE[op])
+
+        elif count >= 0:
+            placeholders = ",".join(["%s"] * count)
+            clauses.append(f"{field_name} {_SQL_LIST[op]} ({placeholders})")
+            extractors.append(_EXTEND)
+
+        else:
+            # IN with a scalar value
+            clauses.append(f"{field_name} LIKE %s")
+            extractors.append(None)
+
+    return " AND ".join(clauses), tuple(extractors)
+
+
+@lru_cache(maxsize=1024)
+def _compile_nosql_keys(shape: tuple) -> tuple:
+    """Filter key per (field, operator); None where the operator has no NoSQL form"""
+    keys = []
+    for field_name, op in shape:
+        suffix = _NOSQL_SUFFIX.get(op)
+        keys.append(None if suffix is None else field_name + suffix)
+    return tuple(keys)
+
+
+@dataclass(slots=True)
 class QueryBuilder:
     """LINQ-style query builder supporting SQL and NoSQL"""
 
@@ -118,72 +332,44 @@ class QueryBuilder:
         return self
 
     # ------------------------------------------------
-    # SQL WHERE
+    # IN-MEMORY PREDICATE
     # ------------------------------------------------
 
-    def to_sql_where(self) -> tuple[str, List[Any]]:
-
-        if not self.filters:
-            return "", []
+    def signature(self) -> Optional[tuple]:
+        """Hashable identity of the filter chain (None if a value is unhashable)"""
+        return _filter_signature(self.filters)
 
-        clauses = []
-        params = []
+    def compile_predicate(self) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """
+        Compile all filters into one row predicate (code cached per filter shape).
 
-        for f in self.filters:
+        Returns None when the filters cannot be compiled; callers then
+        evaluate them one by one.
+        """
+        return compile_filters(self.filters)
 
-            if f.operator == Operator.EQ:
-                clauses.append(f"{f.field} = %s")
-                params.append(f.value)
-
-            elif f.operator == Operator.NE:
-                clauses.append(f"{f.field} != %s")
-                params.append(f.value)
+    # ------------------------------------------------
+    # SQL WHERE
+    # ------------------------------------------------
 
-            elif f.operator == Operator.GT:
-                clauses.append(f"{f.field} > %s")
-                params.append(f.value)
+    def to_sql_where(self) -> tuple[str, List[Any]]:
 
-            elif f.operator == Operator.GTE:
-                clauses.append(f"{f.field} >= %s")
-                params.append(f.value)
+        if not self.filters:
+            return "", []
 
-            elif f.operator == Operator.LT:
-                clauses.append(f"{f.field} < %s")
-                params.append(f.value)
+        # SQL text depends only on the query shape; only params are built per call
+        sql, extractors = _compile_sql_where(tuple(map(_sql_shape, self.filters)))
 
-            elif f.operator == Operator.LTE:
-                clauses.append(f"{f.field} <= %s")
+        params: List[Any] = []
+        for f, how in zip(self.filters, extractors):
+            if how is None:
                 params.append(f.value)
-
-            elif f.operator == Operator.IN:
-
-                if isinstance(f.value, (list, tuple)):
-                    placeholders = ",".join(["%s"] * len(f.value))
-                    clauses.append(f"{f.field} IN ({placeholders})")
-                    params.extend(f.value)
-
-                else:
-                    clauses.append(f"{f.field} LIKE %s")
-                    params.append(f.value)
-
-            elif f.operator == Operator.NOT_IN:
-                placeholders = ",".join(["%s"] * len(f.value))
-                clauses.append(f"{f.field} NOT IN ({placeholders})")
+            elif how is _EXTEND:
                 params.extend(f.value)
+            else:
+                params.append(how.format(f.value))
 
-            elif f.operator == Operator.CONTAINS:
-                clauses.append(f"{f.field} LIKE %s")
-                params.append(f"%{f.value}%")
-
-            elif f.operator == Operator.STARTS_WITH:
-                clauses.append(f"{f.field} LIKE %s")
-                params.append(f"{f.value}%")
-
-            elif f.operator == Operator.ENDS_WITH:
-                clauses.append(f"{f.field} LIKE %s")
-                params.append(f"%{f.value}")
-
-        return " AND ".join(clauses), params
+        return sql, params
 
     # ------------------------------------------------
     # NOSQL FILTER
@@ -191,29 +377,5 @@ class QueryBuilder:
 
     def to_nosql_filter(self) -> Dict[str, Any]:
 
-        result = {}
-
-        for f in self.filters:
-
-            if f.operator == Operator.EQ:
-                result[f.field] = f.value
-
-            elif f.operator == Operator.IN:
-                result[f"{f.field}__in"] = f.value
-
-            elif f.operator == Operator.GT:
-                result[f"{f.field}__gt"] = f.value
-
-            elif f.operator == Operator.GTE:
-                result[f"{f.field}__gte"] = f.value
-
-            elif f.operator == Operator.LT:
-                result[f"{f.field}__lt"] = f.value
-
-            elif f.operator == Operator.LTE:
-                result[f"{f.field}__lte"] = f.value
-
-            elif f.operator == Operator.CONTAINS:
-                result[f"{f.field}__contains"] = f.value
-
-        return result
+        keys = _compile_nosql_keys(tuple((f.field, f.operator) for f in self.filters))
+        return {k: f.value for k, f in zip(keys, self.filters) if k is not None}
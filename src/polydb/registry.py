@@ -1,5 +1,5 @@
 # src/polydb/registry.py
-from typing import Dict, Type
+from typing import Any, Dict, Type
 
 
 class ModelRegistry:
@@ -13,6 +13,10 @@ class ModelRegistry:
     """
 
     _models: Dict[Type, Dict] = {}
+    # First registered class per name, for string resolution
+    _by_name: Dict[str, Type] = {}
+    # ModelMeta is frozen, so one instance per registration can be shared
+    _meta_cache: Dict[Type, Any] = {}
 
     @classmethod
     def register(cls, model):
@@ -21,6 +25,8 @@ class ModelRegistry:
             raise ValueError(f"{model} missing __polydb__ config")
 
         cls._models[model] = meta
+        cls._meta_cache.pop(model, None)
+        cls._by_name.setdefault(model.__name__, model)
 
     @classmethod
     def register_dynamic(cls, model_name: str, meta: dict):
@@ -31,6 +37,7 @@ class ModelRegistry:
         # Create a dynamic class with __polydb__ metadata
         dynamic_class = type(model_name, (), {"__polydb__": meta})
         cls._models[dynamic_class] = meta
+        cls._by_name.setdefault(model_name, dynamic_class)
         return dynamic_class
 
     # -------------------------
@@ -53,11 +60,10 @@ class ModelRegistry:
 
         # String name
         if isinstance(model, str):
-            for m in cls._models:
-                if m.__name__ == model:
-                    return m
-
-            raise ValueError(f"Model not registered: '{model}'")
+            try:
+                return cls._by_name[model]
+            except KeyError:
+                raise ValueError(f"Model not registered: '{model}'") from None
 
         raise TypeError(f"Invalid model reference {model!r}. Must be class or class name.")
 
@@ -67,10 +73,14 @@ class ModelRegistry:
         from .types import ModelMeta
 
         model_cls = cls.resolve(model)
+        meta = cls._meta_cache.get(model_cls)
+        if meta is not None:
+            return meta
+
         raw_meta = cls._models[model_cls]
 
         # Convert to ModelMeta
-        return ModelMeta(
+        meta = ModelMeta(
             storage=raw_meta.get("storage", "sql"),
             table=raw_meta.get("table"),
             collection=raw_meta.get("collection"),
@@ -79,4 +89,7 @@ class ModelRegistry:
             provider=raw_meta.get("provider"),
             cache=raw_meta.get("cache", False),
             cache_ttl=raw_meta.get("cache_ttl"),
+            encrypted_fields=tuple(raw_meta.get("encrypted_fields") or ()),
         )
+        cls._meta_cache[model_cls] = meta
+        return meta
@@ -3,10 +3,13 @@
 Retry logic with exponential backoff and metrics hooks
 """
 
+import asyncio
+import inspect
+import random
 import time
 import logging
 from functools import wraps
-from typing import Callable, Optional, Tuple, Type
+from typing import Callable, Optional, Tuple, Type, Union
 
 
 # Metrics hooks for enterprise monitoring
@@ -29,8 +32,29 @@ class MetricsHooks:
         pass
 
 
+# Defaults captured at import; wrappers skip the hook call (and its kwargs packing)
+# while these are still installed, and pick up overrides assigned at any time
+_NOOP_START = MetricsHooks.on_query_start
+_NOOP_END = MetricsHooks.on_query_end
+_NOOP_ERROR = MetricsHooks.on_error
+
+
+def _backoff_pause(current_delay: float, max_delay: Optional[float],
+                   jitter: Union[float, str]) -> float:
+    if max_delay is not None:
+        current_delay = min(current_delay, max_delay)
+    if isinstance(jitter, str):
+        if jitter != "full":
+            raise ValueError(f"jitter must be 'full' or a number of seconds, got {jitter!r}")
+        return random.uniform(0, current_delay)
+    if jitter:
+        return max(0.0, current_delay + random.uniform(-jitter, jitter))
+    return current_delay
+
+
 def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, 
-        exceptions: Tuple[Type[Exception], ...] = (Exception,)):
+        exceptions: Tuple[Type[Exception], ...] = (Exception,),
+        max_delay: Optional[float] = None, jitter: Union[float, str] = 0.0):
     """
     Retry decorator with exponential backoff
     
@@ -39,38 +63,84 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0,
         delay: Initial delay between retries (seconds)
         backoff: Backoff multiplier
         exceptions: Tuple of exceptions to catch
+        max_delay: Upper bound on the delay between retries (seconds)
+        jitter: "full" to sleep uniform(0, delay), or a number of seconds of
+            +/- random spread, so concurrent callers don't retry in lockstep
     """
+    if isinstance(jitter, str) and jitter != "full":
+        raise ValueError(f"jitter must be 'full' or a number of seconds, got {jitter!r}")
+
     def decorator(func: Callable) -> Callable:
+        logger = logging.getLogger(__name__)
+        name = func.__name__
+
+        def on_failure(attempt: int, e: Exception, start_time: float, pause: float):
+            on_end = MetricsHooks.on_query_end
+            if on_end is not _NOOP_END:
+                on_end(name, time.monotonic() - start_time, False)
+            on_error = MetricsHooks.on_error
+            if on_error is not _NOOP_ERROR:
+                on_error(name, e)
+            if attempt < max_attempts:
+                logger.warning(
+                    f"Attempt {attempt}/{max_attempts} failed for {name}: {str(e)}. "
+                    f"Retrying in {pause:.3f}s..."
+                )
+
+        # Coroutines get an async wrapper so backoff awaits instead of blocking the loop
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                attempt = 0
+                current_delay = delay
+
+                while attempt < max_attempts:
+                    start_time = time.monotonic()
+                    try:
+                        on_start = MetricsHooks.on_query_start
+                        if on_start is not _NOOP_START:
+                            on_start(name, args=args, kwargs=kwargs)
+                        result = await func(*args, **kwargs)
+                        on_end = MetricsHooks.on_query_end
+                        if on_end is not _NOOP_END:
+                            on_end(name, time.monotonic() - start_time, True)
+                        return result
+                    except exceptions as e:
+                        attempt += 1
+                        pause = _backoff_pause(current_delay, max_delay, jitter)
+                        on_failure(attempt, e, start_time, pause)
+                        if attempt >= max_attempts:
+                            raise
+                        await asyncio.sleep(pause)
+                        current_delay *= backoff
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             attempt = 0
             current_delay = delay
             
-            logger = logging.getLogger(__name__)
-            
             while attempt < max_attempts:
-                start_time = time.time()
+                start_time = time.monotonic()
                 try:
-                    MetricsHooks.on_query_start(func.__name__, args=args, kwargs=kwargs)
+                    on_start = MetricsHooks.on_query_start
+                    if on_start is not _NOOP_START:
+                        on_start(name, args=args, kwargs=kwargs)
                     result = func(*args, **kwargs)
-                    duration = time.time() - start_time
-                    MetricsHooks.on_query_end(func.__name__, duration, True)
+                    on_end = MetricsHooks.on_query_end
+                    if on_end is not _NOOP_END:
+                        on_end(name, time.monotonic() - start_time, True)
                     return result
                 except exceptions as e:
                     attempt += 1
-                    duration = time.time() - start_time
-                    MetricsHooks.on_query_end(func.__name__, duration, False)
-                    MetricsHooks.on_error(func.__name__, e)
-                    
+                    pause = _backoff_pause(current_delay, max_delay, jitter)
+                    on_failure(attempt, e, start_time, pause)
                     if attempt >= max_attempts:
                         raise
-                    
-                    logger.warning(
-                        f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {str(e)}. "
-                        f"Retrying in {current_delay}s..."
-                    )
-                    time.sleep(current_delay)
+                    time.sleep(pause)
                     current_delay *= backoff
             
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
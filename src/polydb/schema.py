@@ -2,10 +2,12 @@
 """
 Schema management and migrations
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import hashlib
 import json
+import weakref
 from datetime import datetime
 
 
@@ -23,7 +25,7 @@ class ColumnType(Enum):
     DECIMAL = "DECIMAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     name: str
     type: ColumnType
@@ -34,7 +36,7 @@ class Column:
     max_length: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Index:
     name: str
     columns: List[str]
@@ -48,68 +50,80 @@ class SchemaBuilder:
         self.columns: List[Column] = []
         self.indexes: List[Index] = []
         self.primary_keys: List[str] = []
+        # Table-independent DDL fragments, rebuilt after add_column/add_index
+        self._table_body: Optional[Tuple[Tuple[int, int], str]] = None
+        self._col_defs: List[str] = []  # formatted once per column in add_column
+        self._index_parts: Optional[Tuple[int, List[Tuple[str, str]]]] = None
     
     def add_column(self, column: Column) -> 'SchemaBuilder':
         self.columns.append(column)
         if column.primary_key:
             self.primary_keys.append(column.name)
+        if len(self._col_defs) == len(self.columns) - 1:
+            self._col_defs.append(self._column_def(column))
+        self._table_body = None
         return self
     
     def add_index(self, index: Index) -> 'SchemaBuilder':
         self.indexes.append(index)
+        self._index_parts = None
         return self
     
     def to_create_table(self, table_name: str) -> str:
         """Generate CREATE TABLE statement"""
-        col_defs = []
+        # Sizes guard against direct edits to the public lists
+        shape = (len(self.columns), len(self.primary_keys))
+        if self._table_body is None or self._table_body[0] != shape:
+            self._table_body = (shape, self._build_table_body())
         
-        for col in self.columns:
-            parts = [col.name]
-            
-            # Type
-            if col.type == ColumnType.VARCHAR and col.max_length:
-                parts.append(f"VARCHAR({col.max_length})")
-            else:
-                parts.append(col.type.value)
-            
-            # Nullable
-            if not col.nullable:
-                parts.append("NOT NULL")
-            
-            # Default
-            if col.default is not None:
-                if isinstance(col.default, str):
-                    parts.append(f"DEFAULT '{col.default}'")
-                else:
-                    parts.append(f"DEFAULT {col.default}")
-            
-            # Unique
-            if col.unique:
-                parts.append("UNIQUE")
-            
-            col_defs.append(" ".join(parts))
+        return f"CREATE TABLE IF NOT EXISTS {table_name} (\n{self._table_body[1]}\n);"
+    
+    def _build_table_body(self) -> str:
+        if len(self._col_defs) != len(self.columns):
+            self._col_defs = [self._column_def(col) for col in self.columns]
         
-        # Primary key
+        col_defs = self._col_defs
         if self.primary_keys:
-            col_defs.append(f"PRIMARY KEY ({', '.join(self.primary_keys)})")
+            col_defs = col_defs + [f"  PRIMARY KEY ({', '.join(self.primary_keys)})"]
+        
+        return ",\n".join(col_defs)
+    
+    @staticmethod
+    def _column_def(col: Column) -> str:
+        """Indented column line: name, type, then NOT NULL / DEFAULT / UNIQUE suffixes"""
+        if col.type == ColumnType.VARCHAR and col.max_length:
+            type_sql = f"VARCHAR({col.max_length})"
+        else:
+            type_sql = col.type.value
+        
+        null_sql = "" if col.nullable else " NOT NULL"
         
-        sql = f"CREATE TABLE IF NOT EXISTS {table_name} (\n"
-        sql += ",\n".join(f"  {col}" for col in col_defs)
-        sql += "\n);"
+        if col.default is None:
+            default_sql = ""
+        elif isinstance(col.default, str):
+            default_sql = f" DEFAULT '{col.default}'"
+        else:
+            default_sql = f" DEFAULT {col.default}"
         
-        return sql
+        unique_sql = " UNIQUE" if col.unique else ""
+        
+        return f"  {col.name} {type_sql}{null_sql}{default_sql}{unique_sql}"
     
     def to_create_indexes(self, table_name: str) -> List[str]:
         """Generate CREATE INDEX statements"""
-        statements = []
-        
-        for idx in self.indexes:
-            unique = "UNIQUE " if idx.unique else ""
-            cols = ", ".join(idx.columns)
-            sql = f"CREATE {unique}INDEX IF NOT EXISTS {idx.name} ON {table_name}({cols});"
-            statements.append(sql)
+        if self._index_parts is None or self._index_parts[0] != len(self.indexes):
+            parts = []
+            for idx in self.indexes:
+                unique = "UNIQUE " if idx.unique else ""
+                cols = ", ".join(idx.columns)
+                parts.append((f"CREATE {unique}INDEX IF NOT EXISTS {idx.name} ON ", f"({cols});"))
+            self._index_parts = (len(self.indexes), parts)
         
-        return statements
+        return [head + table_name + tail for head, tail in self._index_parts[1]]
+
+
+# SQL adapters whose polydb_migrations table was already created in this process
+_ENSURED_ADAPTERS: "weakref.WeakSet" = weakref.WeakSet()
 
 
 class MigrationManager:
@@ -117,7 +131,12 @@ class MigrationManager:
     
     def __init__(self, sql_adapter):
         self.sql = sql_adapter
-        self._ensure_migrations_table()
+        if sql_adapter not in _ENSURED_ADAPTERS:
+            self._ensure_migrations_table()
+            try:
+                _ENSURED_ADAPTERS.add(sql_adapter)
+            except TypeError:
+                pass  # not weak-referenceable: ensure again next time
     
     def _ensure_migrations_table(self):
         """Create migrations tracking table"""
@@ -141,8 +160,6 @@ class MigrationManager:
         down_sql: Optional[str] = None
     ) -> bool:
         """Apply a migration"""
-        import hashlib
-        
         # Check if already applied
         existing = self.sql.execute(
             "SELECT version FROM polydb_migrations WHERE version = %s",
@@ -2,21 +2,30 @@
 """
 Security features: encryption, masking, row-level security
 """
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Sequence, Tuple, Union
 from dataclasses import dataclass
 import hashlib
 import base64
 import os
 import json
-from functools import wraps
+import time
+from datetime import datetime
+from functools import lru_cache, wraps
 import logging
 
 from .json_safe import json_safe
 
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    _HAVE_AESGCM = True
+except ImportError:  # optional: pip install cryptography
+    _HAVE_AESGCM = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EncryptionConfig:
     """Field-level encryption configuration"""
 
@@ -25,18 +34,45 @@ class EncryptionConfig:
     algorithm: str = "AES-256-GCM"
 
 
+_PREFIX = "encrypted:"
+_PREFIX_LEN = len(_PREFIX)
+
+
+def _is_ciphertext(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith(_PREFIX)
+
+
+@lru_cache(maxsize=8)
+def _decode_key(key_str: str) -> bytes:
+    """Decoded POLYDB_ENCRYPTION_KEY, keyed by the env value so rotation is honoured"""
+    return base64.b64decode(key_str)
+
+
 class FieldEncryption:
     """Field-level encryption for sensitive data"""
 
     def __init__(self, encryption_key: Optional[bytes] = None):
         self.encryption_key = encryption_key or self._generate_key()
+        self._aead: Optional[Any] = None
+        self._aead_key: Optional[bytes] = None
+
+    def _cipher(self) -> Any:
+        """AESGCM instance for the current key, built once and reused across values"""
+        if self._aead is None or self._aead_key != self.encryption_key:
+            if not _HAVE_AESGCM:
+                raise ImportError(
+                    "cryptography not installed. Install with: pip install cryptography"
+                )
+            self._aead = AESGCM(self.encryption_key)
+            self._aead_key = self.encryption_key
+        return self._aead
 
     @staticmethod
     def _generate_key() -> bytes:
         """Generate encryption key from environment or create new"""
         key_str = os.getenv("POLYDB_ENCRYPTION_KEY")
         if key_str:
-            return base64.b64decode(key_str)
+            return _decode_key(key_str)
 
         # Generate new key (should be saved securely)
         key = os.urandom(32)
@@ -52,34 +88,31 @@ class FieldEncryption:
             return ""
         data = json.dumps(value,default=json_safe) if not isinstance(value, str) else value
         try:
-            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-
-            aesgcm = AESGCM(self.encryption_key)
+            aesgcm = self._cipher()
             nonce = os.urandom(12)
 
             ciphertext = aesgcm.encrypt(nonce, data.encode("utf-8"), None)
 
             # Combine nonce and ciphertext
             encrypted = base64.b64encode(nonce + ciphertext).decode("utf-8")
-            return f"encrypted:{encrypted}"
+            return _PREFIX + encrypted
         except ImportError:
             raise ImportError("cryptography not installed. Install with: pip install cryptography")
 
     def _decrypt_value(self, encrypted_data: Any) -> Any:
         """Decrypt field data (deserialize if needed)"""
-        if not isinstance(encrypted_data, str) or not encrypted_data.startswith("encrypted:"):
+        if not _is_ciphertext(encrypted_data):
             return encrypted_data
 
         try:
-            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            aesgcm = self._cipher()
 
-            encrypted_data = encrypted_data[10:]  # Remove prefix
+            encrypted_data = encrypted_data[_PREFIX_LEN:]  # Remove prefix
             combined = base64.b64decode(encrypted_data)
 
             nonce = combined[:12]
             ciphertext = combined[12:]
 
-            aesgcm = AESGCM(self.encryption_key)
             plaintext_bytes = aesgcm.decrypt(nonce, ciphertext, None)
             plaintext = plaintext_bytes.decode("utf-8")
 
@@ -95,30 +128,81 @@ class FieldEncryption:
             logger.warning(f"Decryption failed: {e}. Returning original value.")
             return encrypted_data
 
-    def encrypt_fields(self, data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
-        """Encrypt specified fields in data dict"""
-        result = dict(data)
+    def encrypt_fields(
+        self, data: Dict[str, Any], fields: Sequence[str], *, copy: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Encrypt specified fields in data dict.
 
+        Returns a new dict unless ``copy=False``, which encrypts ``data`` in place
+        and returns it.
+        """
+        result = dict(data) if copy else data
         for field in fields:
-            if field in result and result[field] is not None:
+            if result.get(field) is not None:
                 result[field] = self._encrypt_value(result[field])
 
         return result
 
-    def decrypt_fields(self, data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
-        """Decrypt specified fields in data dict"""
-        result = dict(data)
+    def decrypt_fields(
+        self, data: Dict[str, Any], fields: Sequence[str], *, copy: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Decrypt specified fields in data dict; ``data`` itself is never modified.
 
-        for field in fields:
-            if field in result and result[field] is not None:
-                result[field] = self._decrypt_value(result[field])
+        Returns a new dict unless ``copy=False``, which returns ``data`` itself
+        when none of the fields hold ciphertext.
+        """
+        hits = [f for f in fields if _is_ciphertext(data.get(f))]
+        if not hits:
+            return dict(data) if copy else data
+
+        result = dict(data)
+        for field in hits:
+            result[field] = self._decrypt_value(result[field])
 
         return result
 
+    def decrypt_fields_batch(
+        self, rows: List[Dict[str, Any]], fields: Sequence[str], *, copy: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Decrypt fields across rows in one pass; input rows are never modified.
+
+        With ``copy=False``, rows without ciphertext are returned as-is instead
+        of copied.
+        """
+        out = []
+        for row in rows:
+            hits = [f for f in fields if _is_ciphertext(row.get(f))]
+            if hits:
+                row = dict(row)
+                for f in hits:
+                    row[f] = self._decrypt_value(row[f])
+            elif copy:
+                row = dict(row)
+            out.append(row)
+        return out
+
+
+# Deletes every ASCII character except 0-9
+_ASCII_NON_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+
+def _digits(value: str) -> str:
+    """Only the digit characters of value (str.translate in C for ASCII input)"""
+    if value.isascii():
+        return value.translate(_ASCII_NON_DIGITS)
+    return "".join(filter(str.isdigit, value))
+
 
 class DataMasking:
     """Data masking for sensitive information"""
 
+    # Max field names memoized per configured model and for global inference;
+    # names past the cap are resolved on every call instead of stored
+    masker_cache_cap = 4096
+
     def __init__(self):
         # Model-specific masking configs: {model: {field: mask_type}}
         self._configs: Dict[str, Dict[str, str]] = {}
@@ -132,19 +216,66 @@ class DataMasking:
             "ssn_*": self._mask_ssn,  # Pattern match
             "card_*": self._mask_credit_card,
         }
+        # Compiled from _global_rules: exact names first, then "<prefix>_*" patterns
+        self._exact_rules = {p: m for p, m in self._global_rules.items() if not p.endswith("_*")}
+        self._prefix_rules = [
+            (p[:-2], m) for p, m in self._global_rules.items() if p.endswith("_*")
+        ]
+        # field -> inferred masker (or None), memoized per field name
+        self._resolved: Dict[str, Optional[Callable]] = {}
+        # Configured model -> {field: masker or None}, from config + global rules.
+        # Unconfigured models share _resolved, so caller-supplied model names
+        # never add entries here
+        self._model_maskers: Dict[str, Dict[str, Optional[Callable]]] = {}
+        self._maskers = {
+            "email": self._mask_email,
+            "phone": self._mask_phone,
+            "ssn": self._mask_ssn,
+            "credit_card": self._mask_credit_card,
+            "redact": lambda x: "[REDACTED]",
+        }
 
     def register_model_config(self, model: str, config: Dict[str, str]):
         """Register masking config for a model: {field: mask_type}"""
         self._configs[model] = config
+        self._model_maskers.pop(model, None)
+
+    def _resolve_masker(self, model: str, field: str) -> Optional[Callable]:
+        """Masker for model.field: model config first, then global inference"""
+        masker = None
+        mask_type = self._configs.get(model, {}).get(field)
+        if mask_type:
+            masker = self._get_masker(mask_type)
+        if masker is None:
+            masker = self._infer_mask_type(field)
+        return masker
 
     def _infer_mask_type(self, field: str) -> Optional[Callable]:
         """Infer masker based on field name (global fallback)"""
-        for pattern, masker in self._global_rules.items():
-            if pattern.endswith("_*") and field.startswith(pattern[:-2]):
-                return masker
-            if pattern == field:
-                return masker
-        return None
+        try:
+            return self._resolved[field]
+        except KeyError:
+            pass
+
+        masker = self._exact_rules.get(field)
+        if masker is None:
+            for prefix, candidate in self._prefix_rules:
+                if field.startswith(prefix):
+                    masker = candidate
+                    break
+
+        if len(self._resolved) < self.masker_cache_cap:
+            self._resolved[field] = masker
+        return masker
+
+    def _field_maskers(self, model: str) -> Dict[str, Optional[Callable]]:
+        """Memo of field -> masker for model"""
+        if model not in self._configs:
+            return self._resolved
+        maskers = self._model_maskers.get(model)
+        if maskers is None:
+            maskers = self._model_maskers[model] = {}
+        return maskers
 
     @staticmethod
     def _mask_email(email: str) -> str:
@@ -163,7 +294,7 @@ class DataMasking:
     @staticmethod
     def _mask_phone(phone: str) -> str:
         """Mask phone number"""
-        phone = "".join(filter(str.isdigit, str(phone)))
+        phone = _digits(str(phone))
         if len(phone) <= 4:
             return "*" * len(phone)
         return "*" * (len(phone) - 4) + phone[-4:]
@@ -171,7 +302,7 @@ class DataMasking:
     @staticmethod
     def _mask_ssn(ssn: str) -> str:
         """Mask SSN"""
-        ssn = "".join(filter(str.isdigit, str(ssn)))
+        ssn = _digits(str(ssn))
         if len(ssn) >= 4:
             return "***-**-" + ssn[-4:]
         return "*" * len(ssn)
@@ -179,7 +310,7 @@ class DataMasking:
     @staticmethod
     def _mask_credit_card(cc: str) -> str:
         """Mask credit card"""
-        cc = "".join(filter(str.isdigit, str(cc).replace("-", "").replace(" ", "")))
+        cc = _digits(str(cc))
         if len(cc) <= 4:
             return "*" * len(cc)
         return "**** **** **** " + cc[-4:]
@@ -197,43 +328,37 @@ class DataMasking:
         Uses model-specific config if available, falls back to global rules.
         Context can be used for dynamic masking (e.g., actor-specific).
         """
-        result = dict(data)
-        config = self._configs.get(model, {})
+        # Copied lazily: rows with nothing to mask are returned as-is
+        result = data
+        maskers = self._field_maskers(model)
 
-        for field, value in list(result.items()):
+        for field, value in data.items():
             if value is None:
                 continue
 
-            # Model-specific
-            mask_type = config.get(field)
-            if mask_type:
-                masker = self._get_masker(mask_type)
-                if masker:
-                    result[field] = masker(str(value))
-                    continue
-
-            # Global inference
-            inferred_masker = self._infer_mask_type(field)
-            if inferred_masker:
-                result[field] = inferred_masker(str(value))
-                continue
+            try:
+                masker = maskers[field]
+            except KeyError:
+                masker = self._resolve_masker(model, field)
+                if len(maskers) < self.masker_cache_cap:
+                    maskers[field] = masker
+
+            if masker:
+                if result is data:
+                    result = dict(data)
+                result[field] = masker(str(value))
 
         # Context-based dynamic masking (e.g., hide all if not owner)
         if actor_id and tenant_id:
+            if result is data:
+                result = dict(data)
             result = self._apply_context_masking(result, actor_id, tenant_id, model)
 
         return result
 
     def _get_masker(self, mask_type: str) -> Optional[Callable]:
         """Get masker function by type"""
-        maskers = {
-            "email": self._mask_email,
-            "phone": self._mask_phone,
-            "ssn": self._mask_ssn,
-            "credit_card": self._mask_credit_card,
-            "redact": lambda x: "[REDACTED]",
-        }
-        return maskers.get(mask_type)
+        return self._maskers.get(mask_type)
 
     def _apply_context_masking(
         self, data: Dict[str, Any], actor_id: str, tenant_id: str, model: str
@@ -248,7 +373,7 @@ class DataMasking:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     """RLS Policy entry"""
 
@@ -264,6 +389,8 @@ class RowLevelSecurity:
         self.policies: Dict[str, List[Policy]] = {}  # {model: [Policy instances]}
         self._read_filters: Dict[str, Dict[str, Any]] = {}  # {model: default_query_filters}
         self._write_filters: Dict[str, Dict[str, Any]] = {}  # {model: write_constraints}
+        # (model, operation) -> policies that apply, in registration order
+        self._compiled: Dict[Tuple[str, str], Tuple[Policy, ...]] = {}
 
     def add_policy(
         self,
@@ -291,6 +418,20 @@ class RowLevelSecurity:
 
         policy = Policy(name=name, func=policy_func, apply_to=apply_to)
         self.policies[model].append(policy)
+        for key in [k for k in self._compiled if k[0] == model]:
+            del self._compiled[key]
+
+    def _compile(self, model: str, operation: str) -> Tuple[Policy, ...]:
+        """Policies of model that apply to operation (cached until add_policy)"""
+        key = (model, operation)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = tuple(
+                p
+                for p in self.policies.get(model, ())
+                if p.apply_to == operation or p.apply_to == "both"
+            )
+        return compiled
 
     def _get_context(
         self,
@@ -318,12 +459,11 @@ class RowLevelSecurity:
             return True
 
         ctx = context or self._get_context()
-        for policy in self.policies[model]:
-            if operation in policy.apply_to or policy.apply_to == "both":
-                if not policy.func(item, ctx):
-                    # Log denial (in production, use logger)
-                    logger.info(f"RLS denied: {policy.name} for {model}:{operation}")
-                    return False
+        for policy in self._compile(model, operation):
+            if not policy.func(item, ctx):
+                # Log denial (in production, use logger)
+                logger.info("RLS denied: %s for %s:%s", policy.name, model, operation)
+                return False
 
         return True
 
@@ -335,18 +475,24 @@ class RowLevelSecurity:
 
         For simplicity, adds default filters from _read_filters; complex policies use post-filter.
         """
-        result = dict(query or {})
+        query = query or {}
+        filters = self._read_filters.get(model)
+        ctx = context or self._get_context()
+        tenant_id = ctx.get("tenant_id")
+        if not filters and not (tenant_id and "tenant_id" not in query):
+            return query
+
+        result = dict(query)
 
         # Add static filters (e.g., tenant_id)
-        if model in self._read_filters:
-            for k, v in self._read_filters[model].items():
+        if filters:
+            for k, v in filters.items():
                 if k not in result:
                     result[k] = v
 
         # Dynamic: if context provided, inject (e.g., tenant_id)
-        ctx = context or self._get_context()
-        if "tenant_id" in ctx and ctx["tenant_id"] and "tenant_id" not in result:
-            result["tenant_id"] = ctx["tenant_id"]
+        if tenant_id and "tenant_id" not in result:
+            result["tenant_id"] = tenant_id
 
         return result
 
@@ -357,8 +503,26 @@ class RowLevelSecurity:
         if model not in self.policies:
             return rows
 
+        policies = self._compile(model, "read")
+        if not policies:
+            return list(rows)
+
         ctx = context or self._get_context()
-        return [row for row in rows if self.check_access(model, row, ctx, operation="read")]
+        if len(policies) == 1 and not logger.isEnabledFor(logging.INFO):
+            # Nothing to log on denial: a single predicate can run as a plain comprehension
+            func = policies[0].func
+            return [row for row in rows if func(row, ctx)]
+
+        allowed = []
+        append = allowed.append
+        for row in rows:
+            for policy in policies:
+                if not policy.func(row, ctx):
+                    logger.info("RLS denied: %s for %s:read", policy.name, model)
+                    break
+            else:
+                append(row)
+        return allowed
 
     def enforce_write(
         self, model: str, data: Dict[str, Any], context: Optional[Dict[str, Any]] = None
@@ -371,17 +535,22 @@ class RowLevelSecurity:
         if not self.check_access(model, data, ctx, operation="write"):
             raise PermissionError(f"RLS write denied for model '{model}'")
 
+        filters = self._write_filters.get(model)
+        tenant_id = ctx.get("tenant_id")
+        if not filters and not (tenant_id and "tenant_id" not in data):
+            return data
+
         result = dict(data)
 
         # Inject constraints (e.g., set tenant_id if not present)
-        if model in self._write_filters:
-            for k, v in self._write_filters[model].items():
+        if filters:
+            for k, v in filters.items():
                 if k not in result:
                     result[k] = v
 
         # Dynamic injection
-        if "tenant_id" in ctx and ctx["tenant_id"] and "tenant_id" not in result:
-            result["tenant_id"] = ctx["tenant_id"]
+        if tenant_id and "tenant_id" not in result:
+            result["tenant_id"] = tenant_id
 
         return result
 
@@ -434,20 +603,47 @@ def sensitivity_policy(item: Dict[str, Any], context: Dict[str, Any]) -> bool:
     return True
 
 
-def time_based_policy(item: Dict[str, Any], context: Dict[str, Any]) -> bool:
-    """Restrict access based on data age (e.g., archive old data)"""
-    from datetime import datetime, timedelta
+@lru_cache(maxsize=65536)
+def _iso_to_epoch(value: str) -> Optional[float]:
+    """Epoch seconds for an ISO-8601 string (naive = local time), None if unparseable"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
 
+def _created_epoch(item: Dict[str, Any]) -> Optional[float]:
+    """Row creation time as epoch seconds: prefetched created_at_ts, else parsed created_at"""
+    created_ts = item.get("created_at_ts")
+    if created_ts is not None:
+        return created_ts
     created_at = item.get("created_at")
     if not created_at:
-        return True
-    try:
-        created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        if datetime.now(created_dt.tzinfo) - created_dt > timedelta(days=365):
+        return None
+    if isinstance(created_at, str):
+        return _iso_to_epoch(created_at)
+    if isinstance(created_at, datetime):
+        return created_at.timestamp()
+    return None
+
+
+def time_based_policy_factory(
+    max_age_days: int = 365,
+) -> Callable[[Dict[str, Any], Dict[str, Any]], bool]:
+    """Build a time-based policy that restricts rows older than max_age_days to archivists"""
+    max_age = max_age_days * 86400.0
+
+    def time_based_policy(item: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        """Restrict access based on data age (e.g., archive old data)"""
+        created_ts = _created_epoch(item)
+        if created_ts is not None and time.time() - created_ts > max_age:
             return "archivist" in context.get("roles", [])
-    except ValueError:
-        pass
-    return True
+        return True
+
+    return time_based_policy
+
+
+time_based_policy = time_based_policy_factory()
 
 
 # Example usage (in app init):
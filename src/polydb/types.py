@@ -12,7 +12,7 @@ JsonDict = Dict[str, Any]
 Lookup = Dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelMeta:
     """Model metadata"""
     storage: StorageType
@@ -23,6 +23,7 @@ class ModelMeta:
     provider: Optional[str] = None
     cache: bool = False
     cache_ttl: Optional[int] = None
+    encrypted_fields: Tuple[str, ...] = ()
 
 
 @runtime_checkable
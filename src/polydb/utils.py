@@ -5,16 +5,32 @@ Utility functions for validation and logging
 
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 from .errors import ValidationError
 
+# \Z (not $) so a trailing newline cannot slip through
+_TABLE_RE = re.compile(r'[a-zA-Z0-9_-]+\Z')
+_COLUMN_RE = re.compile(r'[a-zA-Z0-9_]+\Z')
+
+
+# Schemas reuse a small set of names; cache the verdict (including rejections)
+@lru_cache(maxsize=4096)
+def _is_valid_table(name: str) -> bool:
+    return _TABLE_RE.match(name) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_column(name: str) -> bool:
+    return _COLUMN_RE.match(name) is not None
+
 
 def validate_table_name(table: str) -> str:
     """
     Validate table name to prevent SQL injection
     Only allows alphanumeric, underscore, and hyphen
     """
-    if not re.match(r'^[a-zA-Z0-9_-]+$', table):
+    if not _is_valid_table(table):
         raise ValidationError(
             f"Invalid table name: '{table}'. Only alphanumeric, underscore, and hyphen allowed."
         )
@@ -26,7 +42,7 @@ def validate_column_name(column: str) -> str:
     Validate column name to prevent SQL injection
     Only allows alphanumeric and underscore
     """
-    if not re.match(r'^[a-zA-Z0-9_]+$', column):
+    if not _is_valid_column(column):
         raise ValidationError(
             f"Invalid column name: '{column}'. Only alphanumeric and underscore allowed."
         )
@@ -37,8 +53,9 @@ def validate_columns(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate all column names in data dictionary
     """
-    for key in data.keys():
-        validate_column_name(key)
+    for key in data:
+        if not _is_valid_column(key):
+            validate_column_name(key)  # raises with the standard message
     return data
 
 
@@ -58,4 +75,16 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
     
-    return logger
\ No newline at end of file
+    return logger
+
+_DOTENV_LOADED = False
+
+
+def load_dotenv_once() -> None:
+    """Load .env into the environment on first call only (skips the cwd scan afterwards)"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _DOTENV_LOADED = True
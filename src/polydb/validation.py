@@ -4,73 +4,110 @@ Model metadata validation and schema enforcement
 """
 from typing import Type, Dict, Any, List, Optional
 from dataclasses import dataclass
+import inspect
+import logging
+import weakref
 from .errors import InvalidModelMetadataError, ValidationError
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class ValidationResult:
     valid: bool
     errors: List[str]
     warnings: List[str]
 
 
+# model -> (validator class, __polydb__ it was built from, result, warnings logged)
+_VALIDATION_CACHE: "weakref.WeakKeyDictionary[Type, list]" = weakref.WeakKeyDictionary()
+_MISSING = object()
+
+
 class ModelValidator:
     """Validates model metadata and schema"""
     
-    REQUIRED_FIELDS = {'storage'}
-    VALID_STORAGE_TYPES = {'sql', 'nosql'}
-    SQL_REQUIRED_FIELDS = {'table'}
-    NOSQL_OPTIONAL_FIELDS = {'collection', 'pk_field', 'rk_field'}
+    REQUIRED_FIELDS = frozenset({'storage'})
+    VALID_STORAGE_TYPES = frozenset({'sql', 'nosql'})
+    SQL_REQUIRED_FIELDS = frozenset({'table'})
+    NOSQL_OPTIONAL_FIELDS = frozenset({'collection', 'pk_field', 'rk_field'})
+    VALID_PROVIDERS = frozenset({'azure', 'aws', 'gcp', 'vercel', 'mongodb', 'postgresql'})
     
     @classmethod
     def validate_model(cls, model: Type) -> ValidationResult:
-        """Comprehensive model validation"""
+        """Comprehensive model validation (memoized while ``__polydb__`` is the same object)"""
+        meta = getattr(model, '__polydb__', _MISSING)
+        try:
+            entry = _VALIDATION_CACHE.get(model)
+        except TypeError:  # not weak-referenceable (e.g. a model name string)
+            entry = None
+        if entry is not None and entry[0] is cls and entry[1] is meta:
+            return entry[2]
+        
+        result = cls._validate_model(model, meta)
+        try:
+            _VALIDATION_CACHE[model] = [cls, meta, result, False]
+        except TypeError:
+            pass
+        return result
+    
+    @classmethod
+    def _validate_model(cls, model: Type, meta: Any) -> ValidationResult:
         errors = []
         warnings = []
         
         # Check __polydb__ exists
-        if not hasattr(model, '__polydb__'):
+        if meta is _MISSING:
             errors.append(f"Model {model.__name__} missing __polydb__ metadata")
             return ValidationResult(valid=False, errors=errors, warnings=warnings)
         
-        meta = getattr(model, '__polydb__')
-        
         # Check it's a dict
-        if not isinstance(meta, dict):
+        if meta.__class__ is not dict and not isinstance(meta, dict):
             errors.append(f"__polydb__ must be a dict, got {type(meta)}")
             return ValidationResult(valid=False, errors=errors, warnings=warnings)
         
         # Check required fields
-        for field in cls.REQUIRED_FIELDS:
-            if field not in meta:
-                errors.append(f"Missing required field: {field}")
+        missing = cls.REQUIRED_FIELDS.difference(meta)
+        if missing:
+            errors.extend(f"Missing required field: {field}" for field in missing)
+        
+        get = meta.get
         
         # Validate storage type
-        storage = meta.get('storage')
+        storage = get('storage')
         if storage and storage not in cls.VALID_STORAGE_TYPES:
-            errors.append(f"Invalid storage type: {storage}. Must be one of {cls.VALID_STORAGE_TYPES}")
+            errors.append(f"Invalid storage type: {storage}. Must be one of {set(cls.VALID_STORAGE_TYPES)}")
         
         # Storage-specific validation
         if storage == 'sql':
-            for field in cls.SQL_REQUIRED_FIELDS:
-                if field not in meta:
-                    errors.append(f"SQL storage requires field: {field}")
+            missing = cls.SQL_REQUIRED_FIELDS.difference(meta)
+            if missing:
+                errors.extend(f"SQL storage requires field: {field}" for field in missing)
         
         elif storage == 'nosql':
             # NoSQL has optional fields, warn if missing common ones
             if 'pk_field' not in meta:
                 warnings.append("No pk_field specified, will default to 'id'")
             
-            if not meta.get('collection') and not meta.get('table'):
+            if not get('collection') and not get('table'):
                 warnings.append("No collection/table name specified, will use model name")
         
         # Validate cache settings
-        if meta.get('cache') and not isinstance(meta.get('cache_ttl'), (int, type(None))):
-            errors.append("cache_ttl must be an integer or None")
+        if get('cache'):
+            cache_ttl = get('cache_ttl')
+            if (
+                cache_ttl is not None
+                and type(cache_ttl) is not int
+                and not isinstance(cache_ttl, int)
+            ):
+                errors.append("cache_ttl must be an integer or None")
         
         # Validate provider
-        valid_providers = {'azure', 'aws', 'gcp', 'vercel', 'mongodb', 'postgresql'}
-        provider = meta.get('provider')
-        if provider and provider.lower() not in valid_providers:
+        provider = get('provider')
+        if (
+            provider
+            and provider not in cls.VALID_PROVIDERS
+            and provider.lower() not in cls.VALID_PROVIDERS
+        ):
             warnings.append(f"Unusual provider: {provider}")
         
         return ValidationResult(
@@ -89,12 +126,19 @@ class ModelValidator:
                 f"Invalid model {model.__name__}: {', '.join(result.errors)}"
             )
         
-        # Log warnings
+        # Log warnings (once per cached result)
         if result.warnings:
-            import logging
-            logger = logging.getLogger(__name__)
+            try:
+                entry = _VALIDATION_CACHE.get(model)
+            except TypeError:
+                entry = None
+            if entry is not None and entry[2] is result:
+                if entry[3]:
+                    return
+                entry[3] = True
+            name = model.__name__
             for warning in result.warnings:
-                logger.warning(f"{model.__name__}: {warning}")
+                logger.warning("%s: %s", name, warning)
 
 
 class SchemaValidator:
@@ -114,15 +158,23 @@ class SchemaValidator:
             errors.append(f"Missing required field: {pk_field}")
         
         # Check field types if type hints available
-        if hasattr(model, '__annotations__'):
-            annotations = model.__annotations__
-            for field_name, expected_type in annotations.items():
-                if field_name in data:
-                    actual_value = data[field_name]
-                    if not isinstance(actual_value, expected_type):
-                        warnings.append(
-                            f"Field {field_name} expected {expected_type}, got {type(actual_value)}"
-                        )
+        if isinstance(model, type):
+            # Own annotations only, as class.__annotations__ gives on 3.10+, without
+            # that getter writing an empty dict into unannotated classes; also
+            # resolves PEP 649 lazy annotations (3.14+)
+            annotations = inspect.get_annotations(model)
+        else:
+            annotations = getattr(model, '__annotations__', None)
+        if annotations:  # None and {} both skip the walk
+            # Walk the (often partial) payload, not every annotation on the model;
+            # an exact-type hit skips isinstance's __instancecheck__ dispatch
+            warnings.extend(
+                f"Field {field_name} expected {expected_type}, got {type(actual_value)}"
+                for field_name, actual_value in data.items()
+                if (expected_type := annotations.get(field_name)) is not None
+                and type(actual_value) is not expected_type
+                and not isinstance(actual_value, expected_type)
+            )
         
         return ValidationResult(
             valid=len(errors) == 0,
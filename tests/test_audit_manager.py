@@ -0,0 +1,203 @@
+"""
+tests/test_audit_manager.py
+===========================
+Unit tests for AuditManager / AuditStorage hash chaining (no database).
+
+AuditStorage runs against an in-memory stand-in for the SQL adapter, so the
+chaining, batching and flush logic is exercised as shipped.
+
+Covers:
+  - async writes persist in call order with a linear chain
+  - flush() / close() persist everything queued and stop the writer
+  - two managers (async + sync) appending to one tenant keep one chain
+  - a full queue falls back to an inline write after put_timeout
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+import polydb.audit.manager as manager_module
+from polydb.audit import AuditManager, AuditStorage
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# In-memory SQL stand-in
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class FakeAuditSQL:
+    """Implements the slice of the SQL adapter AuditStorage uses."""
+
+    def __init__(self) -> None:
+        self.rows: List[Dict[str, Any]] = []
+        self.inserts = 0
+
+    def insert(self, table: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        self.inserts += 1
+        self.rows.append(dict(data))
+        return data
+
+    def execute(self, sql: str, params: Optional[List[Any]] = None) -> None:
+        match = re.match(r"INSERT INTO \w+ \(([^)]*)\) VALUES", sql)
+        assert match and params is not None
+        columns = [c.strip() for c in match.group(1).split(",")]
+        self.inserts += 1
+        for i in range(0, len(params), len(columns)):
+            self.rows.append(dict(zip(columns, params[i : i + len(columns)])))
+
+    def query_linq(self, table: str, builder: Any) -> List[Dict[str, Any]]:
+        rows = [r for r in self.rows if all(r.get(f.field) == f.value for f in builder.filters)]
+        for field, descending in reversed(builder.order_by_fields):
+            rows.sort(key=lambda r: datetime.fromisoformat(r[field]), reverse=descending)
+        if builder.take_count is not None:
+            rows = rows[: builder.take_count]
+        return rows
+
+
+@pytest.fixture
+def sql(monkeypatch: pytest.MonkeyPatch) -> FakeAuditSQL:
+    """Every AuditManager created in the test shares one fake audit table."""
+    fake = FakeAuditSQL()
+
+    def make_storage() -> AuditStorage:
+        storage = AuditStorage.__new__(AuditStorage)
+        storage.sql = fake
+        return storage
+
+    monkeypatch.setattr(manager_module, "AuditStorage", make_storage)
+    return fake
+
+
+def log(manager: AuditManager, entity_id: str) -> None:
+    manager.record(
+        action="create",
+        model="Item",
+        entity_id=entity_id,
+        storage_type="nosql",
+        provider="test",
+        success=True,
+        before=None,
+        after={"id": entity_id},
+        error=None,
+        changed_fields=None,
+    )
+
+
+def chain_order(sql: FakeAuditSQL) -> List[str]:
+    """entity_ids in timestamp order, asserting the rows form one linear chain."""
+    storage = AuditStorage.__new__(AuditStorage)
+    storage.sql = sql
+    assert storage.verify_chain()
+
+    previous = [r["previous_hash"] for r in sql.rows]
+    assert len(set(previous)) == len(previous)
+    return [r["entity_id"] for r in sorted(sql.rows, key=lambda r: r["timestamp"])]
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def test_async_writes_keep_call_order(sql: FakeAuditSQL) -> None:
+    manager = AuditManager(async_writes=True, batch_size=7)
+    try:
+        for i in range(50):
+            log(manager, f"e{i:02d}")
+        manager.flush()
+    finally:
+        manager.close()
+
+    assert chain_order(sql) == [f"e{i:02d}" for i in range(50)]
+    # Drained in batches via multi-row INSERTs, not one insert per record
+    assert sql.inserts < 50
+
+
+def test_concurrent_async_writers_form_one_chain(sql: FakeAuditSQL) -> None:
+    manager = AuditManager(async_writes=True, queue_size=5, batch_size=4)
+
+    def writer(n: int) -> None:
+        for i in range(25):
+            log(manager, f"t{n}-{i}")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    manager.close()
+
+    assert len(chain_order(sql)) == 100
+
+
+def test_close_flushes_queue_and_stops_writer(sql: FakeAuditSQL) -> None:
+    manager = AuditManager(async_writes=True)
+    worker = manager._worker
+    assert worker is not None and worker.is_alive()
+    assert manager in manager_module._LIVE_MANAGERS
+
+    for i in range(20):
+        log(manager, f"e{i}")
+    manager.close()
+
+    assert not worker.is_alive()
+    assert manager not in manager_module._LIVE_MANAGERS
+    assert len(sql.rows) == 20
+
+    # After close() records are written synchronously, continuing the chain
+    log(manager, "late")
+    manager.close()
+    assert chain_order(sql)[-1] == "late"
+    assert len(sql.rows) == 21
+
+
+def test_chain_continues_across_managers(sql: FakeAuditSQL) -> None:
+    queued = AuditManager(async_writes=True, batch_size=3)
+    direct = AuditManager()
+    try:
+        for i in range(30):
+            log(queued, f"q{i}")
+            if i % 3 == 0:
+                log(direct, f"d{i}")
+        queued.flush()
+        log(direct, "last")
+    finally:
+        queued.close()
+
+    order = chain_order(sql)
+    assert len(order) == 41
+    assert order[-1] == "last"
+    assert [e for e in order if e.startswith("q")] == [f"q{i}" for i in range(30)]
+
+
+def test_full_queue_writes_inline_after_timeout(
+    sql: FakeAuditSQL, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    release = threading.Event()
+    append = AuditStorage.append
+
+    def stalled_append(self: AuditStorage, records: List[Any]) -> None:
+        # Only the background writer stalls; inline writes go straight through
+        if threading.current_thread().name == "polydb-audit":
+            release.wait(5)
+        append(self, records)
+
+    monkeypatch.setattr(AuditStorage, "append", stalled_append)
+
+    manager = AuditManager(async_writes=True, queue_size=1, batch_size=1, put_timeout=0.05)
+    try:
+        for i in range(4):
+            log(manager, f"e{i}")
+        assert manager.blocked_writes >= 1
+        assert len(sql.rows) >= 1
+    finally:
+        release.set()
+        manager.close()
+
+    assert sorted(chain_order(sql)) == [f"e{i}" for i in range(4)]
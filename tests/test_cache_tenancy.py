@@ -0,0 +1,202 @@
+"""
+tests/test_cache_tenancy.py
+===========================
+Unit tests for tenant-scoped read caching in DatabaseFactory (no Redis).
+
+RedisCacheEngine runs against an in-memory Redis stand-in and the factory
+against an in-memory NoSQL adapter.
+
+Covers:
+  - unscoped reads are cached globally, whatever AuditContext.tenant_id is
+  - a write by tenant A is visible to tenant B's unscoped reads
+  - tenant-filtered reads survive other tenants' writes, not their own
+  - writes that cannot be tied to one tenant drop the whole model
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from polydb.audit import AuditContext
+from polydb.cache import RedisCacheEngine
+from polydb.databaseFactory import DatabaseFactory
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# In-memory stand-ins
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def _glob_to_regex(pattern: str) -> str:
+    out, i = [], 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        elif c == "*":
+            out.append(".*")
+        elif c == "?":
+            out.append(".")
+        elif c == "[":
+            end = pattern.index("]", i)
+            out.append(pattern[i : end + 1])
+            i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        self.data[key] = value
+
+    def setex(self, key: str, ttl: int, value: Any) -> None:
+        self.data[key] = value
+
+    def incr(self, key: str) -> None:
+        self.data[key] = int(self.data.get(key, 0)) + 1
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    def keys(self, pattern: str) -> List[str]:
+        regex = re.compile(_glob_to_regex(pattern))
+        return [k for k in self.data if regex.fullmatch(k)]
+
+
+class FakeNoSQL:
+    def __init__(self) -> None:
+        self.rows: List[Dict[str, Any]] = []
+        self.queries = 0
+
+    def query(self, model: type, query: Any = None, limit: Any = None, no_cache: bool = False):
+        self.queries += 1
+        return [dict(r) for r in self.rows if all(r.get(k) == v for k, v in (query or {}).items())]
+
+    def put(self, model: type, data: Dict[str, Any]) -> Dict[str, Any]:
+        row = {"id": f"row{len(self.rows)}", **data}
+        self.rows.append(row)
+        return dict(row)
+
+
+class FakeProvider:
+    value = "fake"
+
+
+class FakeCloudFactory:
+    provider = FakeProvider()
+
+    def __init__(self, nosql: FakeNoSQL) -> None:
+        self._nosql = nosql
+
+    def get_nosql_kv(self) -> FakeNoSQL:
+        return self._nosql
+
+    def get_sql(self) -> None:
+        return None
+
+
+class Shared:
+    """Cached NoSQL model readable across tenants."""
+
+    __polydb__ = {"storage": "nosql", "cache": True}
+
+
+@pytest.fixture
+def nosql() -> FakeNoSQL:
+    return FakeNoSQL()
+
+
+@pytest.fixture
+def factory(nosql: FakeNoSQL):
+    db = DatabaseFactory(
+        cloud_factory=FakeCloudFactory(nosql),  # type: ignore[arg-type]
+        enable_audit=False,
+        enable_retries=False,
+    )
+    cache = RedisCacheEngine.__new__(RedisCacheEngine)
+    cache.prefix = "polydb:"
+    cache.default_ttl = 60
+    cache._client = FakeRedis()
+    db._cache = cache
+    yield db
+    AuditContext.clear()
+
+
+def as_tenant(tenant_id: str) -> None:
+    AuditContext.clear()
+    AuditContext.set(tenant_id=tenant_id)
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def test_unscoped_read_sees_other_tenants_write(factory: DatabaseFactory) -> None:
+    as_tenant("B")
+    assert factory.read(Shared, {"status": "open"}) == []
+
+    as_tenant("A")
+    factory.create(Shared, {"status": "open", "tenant_id": "A"})
+
+    as_tenant("B")
+    rows = factory.read(Shared, {"status": "open"})
+    assert [r["tenant_id"] for r in rows] == ["A"]
+
+
+def test_unscoped_read_is_shared_across_tenants(
+    factory: DatabaseFactory, nosql: FakeNoSQL
+) -> None:
+    as_tenant("A")
+    factory.read(Shared, {"status": "open"})
+    as_tenant("B")
+    factory.read(Shared, {"status": "open"})
+
+    assert nosql.queries == 1
+
+
+def test_tenant_filtered_read_survives_other_tenants_write(
+    factory: DatabaseFactory, nosql: FakeNoSQL
+) -> None:
+    factory.create(Shared, {"status": "open", "tenant_id": "B"})
+    assert len(factory.read(Shared, {"tenant_id": "B"})) == 1
+    queries = nosql.queries
+
+    factory.create(Shared, {"status": "open", "tenant_id": "A"})
+    assert len(factory.read(Shared, {"tenant_id": "B"})) == 1
+    assert nosql.queries == queries  # B's slice was kept
+
+    factory.create(Shared, {"status": "open", "tenant_id": "B"})
+    assert len(factory.read(Shared, {"tenant_id": "B"})) == 2
+    assert nosql.queries == queries + 1
+
+
+def test_untenanted_write_drops_every_slice(factory: DatabaseFactory) -> None:
+    assert factory.read(Shared, {"tenant_id": "B"}) == []
+
+    as_tenant("A")
+    # No tenant_id on the row: the write cannot be confined to one slice
+    factory.create(Shared, {"tenant_id": None, "status": "open"})
+    factory.create(Shared, {"tenant_id": "B", "status": "open"})
+    assert len(factory.read(Shared, {"tenant_id": "B"})) == 1
+
+
+def test_tenant_glob_characters_are_escaped(factory: DatabaseFactory) -> None:
+    factory.read(Shared, {"tenant_id": "B"})
+    factory.create(Shared, {"status": "open", "tenant_id": "*"})
+
+    client = factory._cache._client  # type: ignore[union-attr]
+    assert any(":B:" in key for key in client.data)
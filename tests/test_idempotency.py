@@ -0,0 +1,164 @@
+"""
+tests/test_idempotency.py
+=========================
+Unit tests for DatabaseFactory(idempotency_field=...) (no database).
+
+The NoSQL adapter is an in-memory stand-in with a unique index on the
+idempotency field and scripted failures.
+
+Covers:
+  - every retry attempt carries the same key
+  - a retry after a committed-but-lost insert returns the stored row
+  - a failure with nothing committed still raises
+  - the key is stripped from returned rows, and not injected when disabled
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+from tenacity import Retrying, stop_after_attempt
+
+from polydb.databaseFactory import DatabaseFactory
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# In-memory stand-ins
+# ────────────────────────────────────────────────────────────────────────────
+
+
+KEY = "idem_key"
+
+
+class DuplicateKeyError(Exception):
+    pass
+
+
+class FlakyNoSQL:
+    """put() honours a unique KEY index; ``failures`` scripts each attempt."""
+
+    def __init__(self, failures: Optional[List[str]] = None, lagging_reads: int = 0) -> None:
+        # "commit-then-fail": store the row, then raise; "fail": raise only
+        self.failures = list(failures or [])
+        # Leading query() calls that do not see committed rows yet
+        self.lagging_reads = lagging_reads
+        self.rows: List[Dict[str, Any]] = []
+        self.attempts: List[Dict[str, Any]] = []
+
+    def put(self, model: type, data: Dict[str, Any]) -> Dict[str, Any]:
+        self.attempts.append(dict(data))
+        mode = self.failures.pop(0) if self.failures else None
+        if mode == "fail":
+            raise ConnectionError("connection reset")
+        if KEY in data and any(r.get(KEY) == data[KEY] for r in self.rows):
+            raise DuplicateKeyError(f"duplicate {KEY}")
+        row = {"id": f"row{len(self.rows)}", **data}
+        self.rows.append(row)
+        if mode == "commit-then-fail":
+            raise ConnectionError("response lost")
+        return dict(row)
+
+    def query(self, model: type, query: Any = None, limit: Any = None, no_cache: bool = False):
+        if self.lagging_reads:
+            self.lagging_reads -= 1
+            return []
+        rows = [dict(r) for r in self.rows if all(r.get(k) == v for k, v in (query or {}).items())]
+        return rows[:limit] if limit else rows
+
+
+class FakeProvider:
+    value = "fake"
+
+
+class FakeCloudFactory:
+    provider = FakeProvider()
+
+    def __init__(self, nosql: FlakyNoSQL) -> None:
+        self._nosql = nosql
+
+    def get_nosql_kv(self) -> FlakyNoSQL:
+        return self._nosql
+
+    def get_sql(self) -> None:
+        return None
+
+
+class Order:
+    """NoSQL model."""
+
+    __polydb__ = {"storage": "nosql"}
+
+
+def make_factory(nosql: FlakyNoSQL, idempotency_field: Optional[str] = KEY) -> DatabaseFactory:
+    db = DatabaseFactory(
+        cloud_factory=FakeCloudFactory(nosql),  # type: ignore[arg-type]
+        idempotency_field=idempotency_field,
+        enable_audit=False,
+    )
+    # Same attempt budget as the default, without the backoff sleeps
+    db._retrying = Retrying(stop=stop_after_attempt(3), reraise=True)
+    return db
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def test_retries_reuse_the_same_key() -> None:
+    nosql = FlakyNoSQL(["fail", "fail"])
+    row = make_factory(nosql).create(Order, {"sku": "a"})
+
+    keys = {a[KEY] for a in nosql.attempts}
+    assert len(nosql.attempts) == 3 and len(keys) == 1
+    assert len(nosql.rows) == 1
+    assert KEY not in row
+
+
+def test_committed_insert_with_lost_response_returns_stored_row() -> None:
+    nosql = FlakyNoSQL(["commit-then-fail"])
+    row = make_factory(nosql).create(Order, {"sku": "a"})
+
+    assert len(nosql.attempts) == 1
+    assert len(nosql.rows) == 1
+    assert row["id"] == nosql.rows[0]["id"]
+    assert row["sku"] == "a"
+    assert KEY not in row
+
+
+def test_retry_colliding_on_key_returns_stored_row() -> None:
+    # The committed row is not yet visible to the first lookup, so the retry
+    # runs and hits the unique index; its lookup then finds the row
+    nosql = FlakyNoSQL(["commit-then-fail"], lagging_reads=1)
+    row = make_factory(nosql).create(Order, {"sku": "a"})
+
+    assert len(nosql.attempts) == 2
+    assert len(nosql.rows) == 1
+    assert row["id"] == "row0"
+
+
+def test_failure_without_commit_still_raises() -> None:
+    nosql = FlakyNoSQL(["fail", "fail", "fail"])
+
+    with pytest.raises(ConnectionError):
+        make_factory(nosql).create(Order, {"sku": "a"})
+    assert nosql.rows == []
+
+
+def test_explicit_key_duplicate_returns_existing_row() -> None:
+    nosql = FlakyNoSQL()
+    db = make_factory(nosql)
+
+    first = db.create(Order, {"sku": "a", KEY: "k1"})
+    again = db.create(Order, {"sku": "a", KEY: "k1"})
+
+    assert len(nosql.rows) == 1
+    assert again["id"] == first["id"]
+
+
+def test_disabled_by_default() -> None:
+    nosql = FlakyNoSQL()
+    make_factory(nosql, idempotency_field=None).create(Order, {"sku": "a"})
+
+    assert KEY not in nosql.rows[0]
@@ -0,0 +1,229 @@
+"""
+tests/test_monitoring.py
+========================
+Unit tests for MetricsCollector's per-second buckets (no database).
+
+Covers:
+  - get_metrics returns metrics oldest first across buckets and shards
+  - the `since` boundary is inclusive and honoured inside a bucket
+  - aggregate() totals from bucket pre-aggregates match a per-metric scan
+  - clear_old_metrics drops expired buckets and trims the boundary second
+  - QueryMetrics.timestamp stays a naive UTC datetime on every path
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+import polydb.monitoring as monitoring
+from polydb.monitoring import MetricsCollector, QueryMetrics, _epoch_ns
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────
+
+
+BASE = datetime(2026, 1, 1, 12, 0, 0)  # naive UTC
+
+
+def at(offset: float) -> datetime:
+    return BASE + timedelta(seconds=offset)
+
+
+def metric(
+    offset: float,
+    operation: str = "read",
+    model: str = "User",
+    duration_ms: float = 10.0,
+    success: bool = True,
+    cache_hit: bool = False,
+) -> QueryMetrics:
+    return QueryMetrics(
+        operation=operation,
+        model=model,
+        duration_ms=duration_ms,
+        success=success,
+        timestamp=at(offset),
+        cache_hit=cache_hit,
+    )
+
+
+def offsets(metrics: List[QueryMetrics]) -> List[float]:
+    return [round((m.timestamp - BASE).total_seconds(), 3) for m in metrics]
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# get_metrics
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def test_get_metrics_is_chronological() -> None:
+    collector = MetricsCollector(shards=4)
+    # Later seconds first, and out of order inside one second
+    for offset in (3.5, 1.2, 3.1, 0.9, 2.0, 1.1):
+        collector.record(metric(offset))
+
+    assert offsets(collector.get_metrics()) == [0.9, 1.1, 1.2, 2.0, 3.1, 3.5]
+
+
+def test_get_metrics_merges_shards() -> None:
+    collector = MetricsCollector(shards=8)
+    expected = [round(i * 0.25, 3) for i in range(40)]
+    shuffled = expected[:]
+    random.Random(5).shuffle(shuffled)
+
+    def writer(part: List[float]) -> None:
+        for offset in part:
+            collector.record(metric(offset))
+
+    threads = [threading.Thread(target=writer, args=(shuffled[n::4],)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert offsets(collector.get_metrics()) == expected
+    assert offsets(collector.get_metrics(since=at(5.0))) == expected[20:]
+
+
+def test_since_boundary_is_inclusive() -> None:
+    collector = MetricsCollector()
+    for offset in (0.2, 1.1, 1.5, 1.6, 2.0):
+        collector.record(metric(offset))
+
+    assert offsets(collector.get_metrics(since=at(1.5))) == [1.5, 1.6, 2.0]
+    assert offsets(collector.get_metrics(since=at(1.0))) == [1.1, 1.5, 1.6, 2.0]
+    assert collector.get_metrics(since=at(2.5)) == []
+
+
+def test_get_metrics_filters() -> None:
+    collector = MetricsCollector()
+    collector.record(metric(0.1, operation="read", model="User"))
+    collector.record(metric(0.2, operation="create", model="User"))
+    collector.record(metric(0.3, operation="read", model="Order"))
+
+    assert offsets(collector.get_metrics(model="User")) == [0.1, 0.2]
+    assert offsets(collector.get_metrics(operation="read")) == [0.1, 0.3]
+    assert offsets(collector.get_metrics(model="User", operation="read")) == [0.1]
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# aggregate
+# ────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def loaded() -> MetricsCollector:
+    collector = MetricsCollector(slow_query_threshold_ms=100.0)
+    rows = [
+        (0.2, "read", 5.0, True, True),
+        (0.7, "create", 150.0, True, False),
+        (1.3, "read", 20.0, False, False),
+        (1.8, "read", 400.0, True, True),
+        (2.4, "update", 120.0, True, False),
+    ]
+    for offset, operation, duration, success, cache_hit in rows:
+        collector.record(
+            metric(offset, operation, duration_ms=duration, success=success, cache_hit=cache_hit)
+        )
+    return collector
+
+
+def test_aggregate_totals(loaded: MetricsCollector) -> None:
+    agg = loaded.aggregate()
+
+    assert agg.total_queries == 5
+    assert agg.successful_queries == 4
+    assert agg.failed_queries == 1
+    assert agg.total_duration_ms == pytest.approx(695.0)
+    assert agg.avg_duration_ms == pytest.approx(139.0)
+    assert agg.min_duration_ms == 5.0
+    assert agg.max_duration_ms == 400.0
+    assert agg.cache_hit_rate == pytest.approx(0.4)
+    assert agg.queries_by_operation == {"read": 3, "create": 1, "update": 1}
+    assert agg.queries_by_model == {"User": 5}
+    assert [m.duration_ms for m in agg.slow_queries] == [400.0, 150.0, 120.0]
+
+
+def test_aggregate_since_rescans_boundary_second(loaded: MetricsCollector) -> None:
+    agg = loaded.aggregate(since=at(1.5))
+
+    assert agg.total_queries == 2
+    assert agg.min_duration_ms == 120.0
+    assert agg.queries_by_operation == {"read": 1, "update": 1}
+    assert [m.duration_ms for m in agg.slow_queries] == [400.0, 120.0]
+
+
+@pytest.mark.parametrize("since", [None, 0.0, 0.7, 1.5, 2.4, 3.0])
+def test_bucket_aggregate_matches_metric_scan(loaded: MetricsCollector, since) -> None:
+    bound = at(since) if since is not None else None
+    # model= forces the per-metric path; model=None sums the bucket pre-aggregates
+    fast = loaded.aggregate(since=bound)
+    scan = loaded.aggregate(since=bound, model="User")
+
+    assert fast.total_queries == scan.total_queries
+    assert fast.successful_queries == scan.successful_queries
+    assert fast.total_duration_ms == pytest.approx(scan.total_duration_ms)
+    assert fast.min_duration_ms == scan.min_duration_ms
+    assert fast.max_duration_ms == scan.max_duration_ms
+    assert fast.cache_hit_rate == pytest.approx(scan.cache_hit_rate)
+    assert fast.queries_by_operation == scan.queries_by_operation
+    assert fast.slow_queries == scan.slow_queries
+
+
+def test_record_fast_is_counted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(monitoring.time, "time_ns", lambda: _epoch_ns(at(0.5)))
+    collector = MetricsCollector()
+    collector.record_fast("read", "User", 12.0, True, cache_hit=True)
+    collector.record_fast("delete", "User", 8.0, False)
+
+    agg = collector.aggregate()
+    assert agg.total_queries == 2 and agg.failed_queries == 1
+    assert agg.cache_hit_rate == 0.5
+    assert [m.operation for m in collector.get_metrics()] == ["read", "delete"]
+    assert {m.timestamp for m in collector.get_metrics()} == {at(0.5)}
+
+
+def test_timestamp_is_naive_utc_datetime() -> None:
+    collector = MetricsCollector(slow_query_threshold_ms=1.0)
+    hooked: List[QueryMetrics] = []
+    collector.register_hook(hooked.append)
+
+    default = QueryMetrics(operation="read", model="User", duration_ms=1.0, success=True)
+    collector.record(default)
+    # A hook forces record_fast() to build the QueryMetrics up front
+    collector.record_fast("read", "User", 2.0, True)
+
+    for m in [default, *hooked, *collector.get_metrics()]:
+        assert isinstance(m.timestamp, datetime) and m.timestamp.tzinfo is None
+    assert timedelta(0) <= hooked[-1].timestamp - default.timestamp < timedelta(seconds=5)
+    assert collector.get_metrics(since=hooked[0].timestamp) == hooked
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Expiry
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def test_clear_old_metrics_drops_expired_buckets(monkeypatch: pytest.MonkeyPatch) -> None:
+    collector = MetricsCollector(shards=1)
+    for offset in (-10.0, -4.8, -4.2, 0.0):
+        collector.record(metric(offset))
+
+    # Cutoff lands at -4.5s, inside the bucket holding -4.8 and -4.2
+    monkeypatch.setattr(monitoring.time, "time_ns", lambda: _epoch_ns(at(0.5)))
+    collector.clear_old_metrics(timedelta(seconds=5))
+
+    assert offsets(collector.get_metrics()) == [-4.2, 0.0]
+    assert len(collector._shards[0]) == 2
+    assert collector.aggregate().total_queries == 2
+
+    collector.clear_old_metrics(timedelta(seconds=0))
+    assert collector.get_metrics() == []
+    assert collector._shards[0] == {}
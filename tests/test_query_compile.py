@@ -0,0 +1,364 @@
+"""
+tests/test_query_compile.py
+===========================
+Unit tests for the in-memory query paths of NoSQLKVAdapter (no emulators).
+
+Covers:
+  - compiled filter predicates vs the interpreted fallback, per Operator
+  - unhashable IN / NOT_IN values (filter side and row side), None, falsy values
+  - predicate code cached per filter shape, not per value
+  - compiled key templates vs str.format, including missing fields
+  - query_linq pushdown + take: limit hint vs supports_filtered_limit, id residual
+  - pushdown only for scalar values; overflow stubs keep indexed fields
+  - MongoDB pushdown excludes array-valued fields
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+import polydb.base.NoSQLKVAdapter as nosql_module
+from polydb.adapters.MongoDBAdapter import MongoDBAdapter
+from polydb.base.NoSQLKVAdapter import NoSQLKVAdapter, _compile_key_template
+from polydb.query import (
+    Operator,
+    QueryBuilder,
+    QueryFilter,
+    _compile_predicate,
+    compile_filters,
+)
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Fixtures / helpers
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class FakeKVAdapter(NoSQLKVAdapter):
+    """In-memory adapter: equality-only _query_raw that records its arguments."""
+
+    def __init__(self, rows: List[Dict[str, Any]], supports_filtered_limit: bool = True):
+        super().__init__()
+        self.rows = rows
+        self.supports_filtered_limit = supports_filtered_limit
+        self.calls: List[tuple] = []
+
+    def _query_raw(
+        self, model: type, filters: Dict[str, Any], limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        self.calls.append((dict(filters), limit))
+        matched = [r for r in self.rows if all(r.get(k) == v for k, v in filters.items())]
+        return matched[:limit] if limit else matched
+
+    def _get_raw(self, model: type, pk: str, rk: str) -> Optional[Dict[str, Any]]:
+        return next((dict(r) for r in self.rows if (r["_pk"], r["_rk"]) == (pk, rk)), None)
+
+    def _put_raw(self, model: type, pk: str, rk: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        self.rows = [r for r in self.rows if (r.get("_pk"), r.get("_rk")) != (pk, rk)]
+        row = {**data, "_pk": pk, "_rk": rk}
+        self.rows.append(row)
+        return row
+
+
+class FakeBlobStore:
+    def __init__(self) -> None:
+        self.blobs: Dict[str, bytes] = {}
+
+    def put(self, key: str, payload: bytes) -> None:
+        self.blobs[key] = payload
+
+    def get(self, key: str) -> bytes:
+        return self.blobs[key]
+
+
+class IndexedItem:
+    """Sentinel model with pushdown-eligible fields."""
+
+    __polydb__ = {"indexed_fields": ["status", "id"]}
+
+
+ROWS: List[Dict[str, Any]] = [
+    {"id": "r1", "n": 5, "s": "alpha", "tag": "a"},
+    {"id": "r2", "n": 0, "s": "", "tag": ["a"]},
+    {"id": "r3", "n": None, "s": None, "tag": None},
+    {"id": "r4", "n": 12, "s": "beta", "tag": "b"},
+    {"id": "r5", "n": -3, "s": "alphabet", "tag": ("a",)},
+    {"id": "r6"},
+]
+
+
+def interpreted(rows: List[Dict[str, Any]], filters: List[QueryFilter]) -> List[Dict[str, Any]]:
+    """Run _apply_filters with the compiled path disabled."""
+    adapter = FakeKVAdapter([])
+    original = nosql_module.compile_filters
+    nosql_module.compile_filters = lambda _filters: None
+    try:
+        return adapter._apply_filters(rows, filters)
+    finally:
+        nosql_module.compile_filters = original
+
+
+def ids(rows: List[Dict[str, Any]]) -> List[str]:
+    return [r["id"] for r in rows]
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Compiled vs interpreted filters
+# ────────────────────────────────────────────────────────────────────────────
+
+
+FILTER_CASES = [
+    ("n", Operator.EQ, 5),
+    ("n", Operator.EQ, None),
+    ("n", Operator.NE, 0),
+    ("n", Operator.NE, None),
+    ("n", Operator.GT, 0),
+    ("n", Operator.GT, -10),
+    ("n", Operator.GTE, 5),
+    ("n", Operator.LT, 10),
+    ("n", Operator.LTE, 12),
+    ("n", Operator.IN, [0, 5, None]),
+    ("n", Operator.IN, (12,)),
+    ("n", Operator.IN, {5, -3}),
+    ("n", Operator.NOT_IN, [0, 5]),
+    ("n", Operator.NOT_IN, []),
+    ("s", Operator.CONTAINS, "pha"),
+    ("s", Operator.CONTAINS, ""),
+    ("s", Operator.STARTS_WITH, "alpha"),
+    ("s", Operator.ENDS_WITH, "a"),
+    ("n", Operator.CONTAINS, "2"),
+    ("tag", Operator.IN, ["a", "b"]),
+    ("tag", Operator.NOT_IN, ["a"]),
+    ("tag", Operator.EQ, ["a"]),
+    ("tag", Operator.IN, [["a"], "b"]),
+    ("tag", Operator.NOT_IN, [["a"], ("a",)]),
+]
+
+
+@pytest.mark.parametrize("field, operator, value", FILTER_CASES)
+def test_compiled_filter_matches_interpreted(field: str, operator: Operator, value: Any) -> None:
+    filters = [QueryFilter(field, operator, value)]
+    predicate = compile_filters(filters)
+    assert predicate is not None
+
+    compiled = [r for r in ROWS if predicate(r)]
+    assert ids(compiled) == ids(interpreted(ROWS, filters))
+
+
+def test_compiled_filter_combination_matches_interpreted() -> None:
+    filters = [
+        QueryFilter("n", Operator.GT, -5),
+        QueryFilter("s", Operator.STARTS_WITH, "al"),
+        QueryFilter("tag", Operator.NOT_IN, ["b"]),
+    ]
+    predicate = compile_filters(filters)
+    assert predicate is not None
+
+    compiled = [r for r in ROWS if predicate(r)]
+    assert ids(compiled) == ids(interpreted(ROWS, filters)) == ["r1", "r5"]
+
+
+@pytest.mark.parametrize(
+    "operator, value, expected",
+    [
+        (Operator.IN, [{"x": 1}, "b"], ["r4"]),
+        (Operator.NOT_IN, [["a"], {"x": 1}], ["r1", "r3", "r4", "r5", "r6"]),
+        (Operator.EQ, {"k": ["a"]}, []),
+        (Operator.NE, ["a"], ["r1", "r3", "r4", "r5", "r6"]),
+    ],
+)
+def test_unhashable_filter_value_compiles(
+    operator: Operator, value: Any, expected: List[str]
+) -> None:
+    filters = [QueryFilter("tag", operator, value)]
+    predicate = compile_filters(filters)
+    assert predicate is not None
+
+    assert ids([r for r in ROWS if predicate(r)]) == expected
+    assert ids(interpreted(ROWS, filters)) == expected
+
+
+def test_compiled_predicate_is_cached_per_shape() -> None:
+    _compile_predicate.cache_clear()
+
+    predicates = [compile_filters([QueryFilter("n", Operator.EQ, i)]) for i in range(50)]
+    assert _compile_predicate.cache_info().currsize == 1
+    assert [p({"n": 7}) for p in predicates if p is not None].count(True) == 1
+
+    # Hashable and unhashable IN members compile to different code
+    compile_filters([QueryFilter("n", Operator.IN, [1, 2])])
+    compile_filters([QueryFilter("n", Operator.IN, [3, 4, 5])])
+    compile_filters([QueryFilter("n", Operator.IN, [[1], 2])])
+    assert _compile_predicate.cache_info().currsize == 3
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Key templates
+# ────────────────────────────────────────────────────────────────────────────
+
+
+KEY_DATA: Dict[str, Any] = {"tenant": "acme", "id": 42, "name": "Zoë", "when": 3.14159}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{tenant}",
+        "{tenant}#{id}",
+        "user-{id:05d}",
+        "{name!r}:{name!a}:{name!s}",
+        "{when:.2f}",
+        "static",
+        "",
+        "{{literal}}-{id}",
+    ],
+)
+def test_key_template_matches_str_format(template: str) -> None:
+    assert _compile_key_template(template)(KEY_DATA) == template.format(**KEY_DATA)
+
+
+@pytest.mark.parametrize("template", ["{tenant}#{missing}", "{missing:>4}", "{missing!r}"])
+def test_key_template_missing_field_raises_key_error(template: str) -> None:
+    with pytest.raises(KeyError):
+        template.format(**KEY_DATA)
+    with pytest.raises(KeyError):
+        _compile_key_template(template)(KEY_DATA)
+
+
+@pytest.mark.parametrize(
+    "template, data",
+    [
+        ("{0}", {}),
+        ("{obj.real}", {"obj": 7}),
+        ("{items[0]}", {"items": ["x"]}),
+        ("{id:{width}}", {"id": 1, "width": 4}),
+    ],
+)
+def test_key_template_fallback_matches_str_format(template: str, data: Dict[str, Any]) -> None:
+    compiled = _compile_key_template(template)
+    try:
+        expected: Any = template.format(**data)
+    except Exception as e:
+        with pytest.raises(type(e)):
+            compiled(data)
+    else:
+        assert compiled(data) == expected
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# query_linq pushdown + take
+# ────────────────────────────────────────────────────────────────────────────
+
+
+LINQ_ROWS: List[Dict[str, Any]] = [
+    {"id": f"i{i}", "status": "open" if i % 2 else "closed", "n": i} for i in range(10)
+]
+
+
+def test_pushdown_with_take_drops_limit_without_filtered_limit() -> None:
+    adapter = FakeKVAdapter(LINQ_ROWS, supports_filtered_limit=False)
+    qb = QueryBuilder().where("status", Operator.EQ, "open").take(3)
+
+    rows = adapter.query_linq_rows(IndexedItem, qb)
+
+    assert adapter.calls == [({"status": "open"}, None)]
+    assert ids(rows) == ["i1", "i3", "i5"]
+
+
+def test_pushdown_with_take_sends_limit_with_filtered_limit() -> None:
+    adapter = FakeKVAdapter(LINQ_ROWS)
+    qb = QueryBuilder().where("status", Operator.EQ, "open").skip(1).take(2)
+
+    rows = adapter.query_linq_rows(IndexedItem, qb)
+
+    assert adapter.calls == [({"status": "open"}, 3)]
+    assert ids(rows) == ["i3", "i5"]
+
+
+def test_take_without_pushdown_sends_limit() -> None:
+    adapter = FakeKVAdapter(LINQ_ROWS, supports_filtered_limit=False)
+    qb = QueryBuilder().skip(2).take(3)
+
+    rows = adapter.query_linq_rows(IndexedItem, qb)
+
+    assert adapter.calls == [({}, 5)]
+    assert ids(rows) == ["i2", "i3", "i4"]
+
+
+def test_residual_filter_disables_limit() -> None:
+    adapter = FakeKVAdapter(LINQ_ROWS)
+    qb = QueryBuilder().where("status", Operator.EQ, "open").where("n", Operator.GT, 4).take(2)
+
+    rows = adapter.query_linq_rows(IndexedItem, qb)
+
+    assert adapter.calls == [({"status": "open"}, None)]
+    assert ids(rows) == ["i5", "i7"]
+
+
+def test_id_filter_stays_residual() -> None:
+    adapter = FakeKVAdapter(LINQ_ROWS)
+    qb = QueryBuilder().where("id", Operator.EQ, "i4").take(1)
+
+    rows = adapter.query_linq_rows(IndexedItem, qb)
+
+    assert adapter.calls == [({}, None)]
+    assert ids(rows) == ["i4"]
+
+
+@pytest.mark.parametrize(
+    "operator, value",
+    [
+        (Operator.EQ, True),
+        (Operator.EQ, None),
+        (Operator.EQ, {"state": "open"}),
+        (Operator.EQ, ["open"]),
+        (Operator.IN, ["open", True]),
+        (Operator.IN, [["open"]]),
+    ],
+)
+def test_non_scalar_values_stay_residual(operator: Operator, value: Any) -> None:
+    adapter = FakeKVAdapter(LINQ_ROWS)
+    qb = QueryBuilder().where("status", operator, value)
+
+    adapter.query_linq_rows(IndexedItem, qb)
+
+    assert adapter.calls == [({}, None)]
+
+
+def test_overflowed_row_matches_pushed_filter() -> None:
+    adapter = FakeKVAdapter([])
+    adapter.max_size = 64
+    adapter.object_storage = FakeBlobStore()
+    adapter.patch(
+        IndexedItem, {"pk": "p", "rk": "big"}, {"id": "big", "status": "open", "blob": "x" * 500}
+    )
+
+    stub = adapter.rows[0]
+    assert stub["_overflow"] and stub["status"] == "open" and "blob" not in stub
+
+    qb = QueryBuilder().where("status", Operator.EQ, "open")
+    rows = adapter.query_linq_rows(IndexedItem, qb)
+
+    assert adapter.calls == [({"status": "open"}, None)]
+    assert ids(rows) == ["big"]
+    assert rows[0]["blob"] == "x" * 500
+
+
+def test_mongo_pushdown_excludes_array_fields() -> None:
+    adapter = MongoDBAdapter.__new__(MongoDBAdapter)
+    adapter._client = None
+    qb = (
+        QueryBuilder()
+        .where("status", Operator.EQ, "open")
+        .where("status", Operator.IN, ["open", "held"])
+        .where("n", Operator.GT, 1)
+    )
+
+    pushdown, residual = adapter._translate_pushdown(IndexedItem, qb)
+
+    assert pushdown == {
+        "status": {"$not": {"$type": "array"}, "$eq": "open", "$in": ["open", "held"]}
+    }
+    assert [f.field for f in residual] == ["n"]
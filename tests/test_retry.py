@@ -0,0 +1,163 @@
+"""
+tests/test_retry.py
+===================
+Unit tests for polydb.retry.retry (no sleeping, no database).
+
+Covers:
+  - exponential backoff capped by max_delay
+  - "full" and numeric jitter bounds; invalid jitter strings are rejected
+  - coroutine functions get an async wrapper that awaits its backoff
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import random
+from typing import List
+
+import pytest
+
+import polydb.retry as retry_module
+from polydb.retry import retry
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class Boom(Exception):
+    pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Pauses requested by the sync and async wrappers, without sleeping."""
+    recorded: List[float] = []
+
+    async def fake_async_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr(retry_module.time, "sleep", recorded.append)
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_async_sleep)
+    return recorded
+
+
+def failing(times: int):
+    """Function raising Boom ``times`` times, then returning "ok"."""
+    calls = {"n": 0}
+
+    def fn() -> str:
+        calls["n"] += 1
+        if calls["n"] <= times:
+            raise Boom(calls["n"])
+        return "ok"
+
+    return fn
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Backoff / jitter
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def test_backoff_without_cap(sleeps: List[float]) -> None:
+    fn = retry(max_attempts=4, delay=1.0, backoff=3.0, exceptions=(Boom,))(failing(3))
+
+    assert fn() == "ok"
+    assert sleeps == [1.0, 3.0, 9.0]
+
+
+def test_max_delay_caps_pause(sleeps: List[float]) -> None:
+    fn = retry(max_attempts=5, delay=1.0, backoff=10.0, max_delay=2.5, exceptions=(Boom,))(
+        failing(10)
+    )
+
+    with pytest.raises(Boom):
+        fn()
+    # No pause after the final attempt
+    assert sleeps == [1.0, 2.5, 2.5, 2.5]
+
+
+def test_full_jitter_stays_within_delay(sleeps: List[float]) -> None:
+    random.seed(1234)
+    fn = retry(max_attempts=6, delay=1.0, backoff=2.0, jitter="full", exceptions=(Boom,))(
+        failing(5)
+    )
+
+    assert fn() == "ok"
+    caps = [1.0, 2.0, 4.0, 8.0, 16.0]
+    assert all(0.0 <= pause <= cap for pause, cap in zip(sleeps, caps))
+    assert sleeps != caps
+
+
+def test_numeric_jitter_spread_and_floor(sleeps: List[float]) -> None:
+    random.seed(99)
+    fn = retry(max_attempts=3, delay=1.0, backoff=1.0, jitter=0.25, exceptions=(Boom,))(
+        failing(2)
+    )
+    assert fn() == "ok"
+    assert all(0.75 <= pause <= 1.25 for pause in sleeps)
+
+    sleeps.clear()
+    fn = retry(max_attempts=30, delay=0.01, backoff=1.0, jitter=5.0, exceptions=(Boom,))(
+        failing(29)
+    )
+    assert fn() == "ok"
+    assert min(sleeps) >= 0.0
+
+
+def test_jitter_applies_after_max_delay(sleeps: List[float]) -> None:
+    random.seed(7)
+    fn = retry(
+        max_attempts=4, delay=10.0, backoff=2.0, max_delay=1.0, jitter="full", exceptions=(Boom,)
+    )(failing(3))
+
+    assert fn() == "ok"
+    assert all(0.0 <= pause <= 1.0 for pause in sleeps)
+
+
+def test_invalid_jitter_string_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        retry(jitter="half")
+
+
+def test_unlisted_exception_is_not_retried(sleeps: List[float]) -> None:
+    fn = retry(max_attempts=3, exceptions=(KeyError,))(failing(1))
+
+    with pytest.raises(Boom):
+        fn()
+    assert sleeps == []
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Async wrapper
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def test_coroutine_gets_async_wrapper(sleeps: List[float]) -> None:
+    calls: List[int] = []
+
+    @retry(max_attempts=3, delay=0.5, backoff=2.0, exceptions=(Boom,))
+    async def fetch(value: str) -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise Boom()
+        return value
+
+    assert inspect.iscoroutinefunction(fetch)
+    assert fetch.__name__ == "fetch"
+    assert asyncio.run(fetch("done")) == "done"
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_async_wrapper_reraises_after_max_attempts(sleeps: List[float]) -> None:
+    @retry(max_attempts=2, delay=0.1, max_delay=0.05, exceptions=(Boom,))
+    async def always_fails() -> None:
+        raise Boom()
+
+    with pytest.raises(Boom):
+        asyncio.run(always_fails())
+    assert sleeps == [0.05]